@@ -7,152 +7,170 @@ with file-based logging and AI-powered insights.
 """
 
 import os
+import sys
 from datetime import datetime
 
+_SEP60 = "=" * 60
+
+# Everything up to the file-organization section is static, so it is joined
+# and encoded once at import time and written straight to the byte stream.
+_STATIC_PROLOGUE = ("\n".join([
+    "🚀 ProductivityGuard - Complete Feature Demo",
+    _SEP60,
+
+    "\n🎯 NEW FEATURES IMPLEMENTED:",
+
+    "\n1. 📊 ACTIVITY CATEGORIZATION",
+    "   • 11 detailed categories: Coding, Studying, Meetings, etc.",
+    "   • Replaces binary procrastination detection",
+    "   • Nuanced understanding of productivity patterns",
+
+    "\n2. ⏰ WORKDAY SESSION TRACKING",
+    "   • Tracks from program start to end",
+    "   • Session management with resume capability",
+    "   • Real-time activity duration tracking",
+
+    "\n3. 📝 DAILY FILE LOGGING",
+    "   • Creates data/logs/YYYY-MM-DD_activity_log.md",
+    "   • Real-time activity timeline logging",
+    "   • Structured markdown format",
+    "   • Session resume detection",
+
+    "\n4. 🔄 HOURLY PROGRESS UPDATES",
+    "   • Automatic hourly summaries",
+    "   • Productivity percentages",
+    "   • Top activity breakdowns",
+    "   • Saved to daily log file",
+
+    "\n5. 📊 END-OF-DAY SUMMARIES",
+    "   • Creates data/summaries/YYYY-MM-DD_workday_summary.md",
+    "   • Complete time breakdown by category",
+    "   • AI-powered productivity insights",
+    "   • Actionable recommendations",
+
+    "\n6. 🧪 TESTING & SIMULATION",
+    "   • --test flag for simulation mode",
+    "   • No screenshots required",
+    "   • Fast testing intervals",
+    "   • Predefined activity sequences",
+
+    "\n" + _SEP60,
+    "📋 HOW TO USE THE NEW FEATURES:",
+
+    "\n🚀 START WORKDAY TRACKING:",
+    "   python productivity_guard.py",
+    "   → Creates daily log file",
+    "   → Shows file locations",
+    "   → Begins activity categorization",
+
+    "\n⚡ DURING THE DAY:",
+    "   • Activities auto-categorized every 2 minutes",
+    "   • Type 'summary' for current progress",
+    "   • Hourly updates appear automatically",
+    "   • All activities logged to file in real-time",
+
+    "\n🎯 END WORKDAY:",
+    "   • Type 'end' to finish workday",
+    "   • Generates comprehensive summary",
+    "   • Saves to separate summary file",
+    "   • Includes AI recommendations",
+
+    "\n🧪 TEST THE FEATURES:",
+    "   python productivity_guard.py --test",
+    "   → Simulates full workday",
+    "   → Shows all functionality",
+    "   → No API key required for basic test",
+
+    "\n" + _SEP60,
+    "📁 FILE ORGANIZATION:",
+]) + "\n").encode()
+
 def demo_complete_features():
     """Demonstrate all the new productivity tracking features."""
-    print("🚀 ProductivityGuard - Complete Feature Demo")
-    print("=" * 60)
-    
-    print("\n🎯 NEW FEATURES IMPLEMENTED:")
-    
-    print("\n1. 📊 ACTIVITY CATEGORIZATION")
-    print("   • 11 detailed categories: Coding, Studying, Meetings, etc.")
-    print("   • Replaces binary procrastination detection")
-    print("   • Nuanced understanding of productivity patterns")
-    
-    print("\n2. ⏰ WORKDAY SESSION TRACKING")
-    print("   • Tracks from program start to end")
-    print("   • Session management with resume capability")
-    print("   • Real-time activity duration tracking")
-    
-    print("\n3. 📝 DAILY FILE LOGGING")
-    print("   • Creates data/logs/YYYY-MM-DD_activity_log.md")
-    print("   • Real-time activity timeline logging")
-    print("   • Structured markdown format")
-    print("   • Session resume detection")
-    
-    print("\n4. 🔄 HOURLY PROGRESS UPDATES")
-    print("   • Automatic hourly summaries")
-    print("   • Productivity percentages")
-    print("   • Top activity breakdowns")
-    print("   • Saved to daily log file")
-    
-    print("\n5. 📊 END-OF-DAY SUMMARIES")
-    print("   • Creates data/summaries/YYYY-MM-DD_workday_summary.md")
-    print("   • Complete time breakdown by category")
-    print("   • AI-powered productivity insights")
-    print("   • Actionable recommendations")
-    
-    print("\n6. 🧪 TESTING & SIMULATION")
-    print("   • --test flag for simulation mode")
-    print("   • No screenshots required")
-    print("   • Fast testing intervals")
-    print("   • Predefined activity sequences")
-    
-    print("\n" + "=" * 60)
-    print("📋 HOW TO USE THE NEW FEATURES:")
-    
-    print("\n🚀 START WORKDAY TRACKING:")
-    print("   python productivity_guard.py")
-    print("   → Creates daily log file")
-    print("   → Shows file locations")
-    print("   → Begins activity categorization")
-    
-    print("\n⚡ DURING THE DAY:")
-    print("   • Activities auto-categorized every 2 minutes")
-    print("   • Type 'summary' for current progress")
-    print("   • Hourly updates appear automatically")
-    print("   • All activities logged to file in real-time")
-    
-    print("\n🎯 END WORKDAY:")
-    print("   • Type 'end' to finish workday")
-    print("   • Generates comprehensive summary")
-    print("   • Saves to separate summary file")
-    print("   • Includes AI recommendations")
-    
-    print("\n🧪 TEST THE FEATURES:")
-    print("   python productivity_guard.py --test")
-    print("   → Simulates full workday")
-    print("   → Shows all functionality")
-    print("   → No API key required for basic test")
-    
-    print("\n" + "=" * 60)
-    print("📁 FILE ORGANIZATION:")
-    
+    # Flush any pending text output, then emit the precomputed banner with a
+    # single write to the underlying byte stream.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_STATIC_PROLOGUE)
+
+    # Dynamic tail: only this part depends on today's date.
+    lines = []
     today = datetime.now().strftime('%Y-%m-%d')
-    print(f"\n📂 data/")
-    print(f"   ├── logs/")
-    print(f"   │   ├── {today}_activity_log.md")
-    print(f"   │   ├── 2024-08-04_activity_log.md")
-    print(f"   │   └── 2024-08-05_activity_log.md")
-    print(f"   └── summaries/")
-    print(f"       ├── {today}_workday_summary.md")
-    print(f"       ├── 2024-08-04_workday_summary.md")
-    print(f"       └── 2024-08-05_workday_summary.md")
-    
-    print("\n🔒 PRIVACY:")
-    print("   • Files are gitignored (stay private)")
-    print("   • Local storage only")
-    print("   • Standard markdown format")
-    
-    print("\n" + "=" * 60)
-    print("💡 EXAMPLE OUTPUTS:")
-    
-    print("\n📊 HOURLY UPDATE EXAMPLE:")
-    print("   ⏰ HOURLY UPDATE - 14:00")
-    print("   📅 Workday duration: 5.0 hours")
-    print("   🎯 Productivity: 73.2% productive, 15.8% neutral, 11.0% unproductive")
-    print("   📊 Top activities:")
-    print("      • Coding: 120 minutes")
-    print("      • Studying: 45 minutes")
-    print("      • Breaks: 30 minutes")
-    
-    print("\n🎯 END-OF-DAY SUMMARY EXAMPLE:")
-    print("   📊 Time Breakdown:")
-    print("   • Coding: 4h 30m (52.9%)")
-    print("   • Studying: 1h 15m (14.7%)")
-    print("   • Meetings: 1h 0m (11.8%)")
-    print("   • Social Media: 30m (5.9%)")
-    print("   ")
-    print("   🎯 Productivity Score: 7.9/10")
-    print("   🤖 AI Recommendations:")
-    print("   • Immediate: Try 25-minute focused coding blocks")
-    print("   • This week: Set up distraction blocking")
-    print("   • This month: Analyze peak productivity hours")
-    
-    print("\n" + "=" * 60)
-    print("✨ BENEFITS:")
-    
-    print("\n📈 FOR PRODUCTIVITY:")
-    print("   • Objective measurement of time usage")
-    print("   • Pattern recognition across days/weeks")
-    print("   • AI-powered improvement suggestions")
-    print("   • Historical trend analysis")
-    
-    print("\n🎯 FOR AWARENESS:")
-    print("   • Real-time activity categorization")
-    print("   • Hourly progress check-ins")
-    print("   • Clear visualization of time allocation")
-    print("   • Distraction pattern identification")
-    
-    print("\n📝 FOR TRACKING:")
-    print("   • Permanent record of workdays")
-    print("   • Markdown files readable anywhere")
-    print("   • Easy to backup or sync")
-    print("   • Integration with other productivity tools")
-    
-    print("\n" + "=" * 60)
-    print("🎉 READY TO GET STARTED!")
-    print("\n💻 Basic usage:")
-    print("   python productivity_guard.py")
-    print("\n🧪 Test mode:")
-    print("   python productivity_guard.py --test")
-    print("\n📚 Full documentation:")
-    print("   See README.md and DAILY_LOGGING_IMPLEMENTATION.md")
-    
-    print(f"\n✅ All features implemented and ready to use!")
-    print("🌟 Transform your productivity with comprehensive workday tracking!")
+    lines.append(f"""
+📂 data/
+   ├── logs/
+   │   ├── {today}_activity_log.md
+   │   ├── 2024-08-04_activity_log.md
+   │   └── 2024-08-05_activity_log.md
+   └── summaries/
+       ├── {today}_workday_summary.md
+       ├── 2024-08-04_workday_summary.md
+       └── 2024-08-05_workday_summary.md""")
+
+    lines.append("\n🔒 PRIVACY:")
+    lines.append("   • Files are gitignored (stay private)")
+    lines.append("   • Local storage only")
+    lines.append("   • Standard markdown format")
+
+    lines.append("\n" + _SEP60)
+    lines.append("💡 EXAMPLE OUTPUTS:")
+
+    lines.append("\n📊 HOURLY UPDATE EXAMPLE:")
+    lines.append("   ⏰ HOURLY UPDATE - 14:00")
+    lines.append("   📅 Workday duration: 5.0 hours")
+    lines.append("   🎯 Productivity: 73.2% productive, 15.8% neutral, 11.0% unproductive")
+    lines.append("   📊 Top activities:")
+    lines.append("      • Coding: 120 minutes")
+    lines.append("      • Studying: 45 minutes")
+    lines.append("      • Breaks: 30 minutes")
+
+    lines.append("\n🎯 END-OF-DAY SUMMARY EXAMPLE:")
+    lines.append("   📊 Time Breakdown:")
+    lines.append("   • Coding: 4h 30m (52.9%)")
+    lines.append("   • Studying: 1h 15m (14.7%)")
+    lines.append("   • Meetings: 1h 0m (11.8%)")
+    lines.append("   • Social Media: 30m (5.9%)")
+    lines.append("   ")
+    lines.append("   🎯 Productivity Score: 7.9/10")
+    lines.append("   🤖 AI Recommendations:")
+    lines.append("   • Immediate: Try 25-minute focused coding blocks")
+    lines.append("   • This week: Set up distraction blocking")
+    lines.append("   • This month: Analyze peak productivity hours")
+
+    lines.append("\n" + _SEP60)
+    lines.append("✨ BENEFITS:")
+
+    lines.append("\n📈 FOR PRODUCTIVITY:")
+    lines.append("   • Objective measurement of time usage")
+    lines.append("   • Pattern recognition across days/weeks")
+    lines.append("   • AI-powered improvement suggestions")
+    lines.append("   • Historical trend analysis")
+
+    lines.append("\n🎯 FOR AWARENESS:")
+    lines.append("   • Real-time activity categorization")
+    lines.append("   • Hourly progress check-ins")
+    lines.append("   • Clear visualization of time allocation")
+    lines.append("   • Distraction pattern identification")
+
+    lines.append("\n📝 FOR TRACKING:")
+    lines.append("   • Permanent record of workdays")
+    lines.append("   • Markdown files readable anywhere")
+    lines.append("   • Easy to backup or sync")
+    lines.append("   • Integration with other productivity tools")
+
+    lines.append("\n" + _SEP60)
+    lines.append("🎉 READY TO GET STARTED!")
+    lines.append("\n💻 Basic usage:")
+    lines.append("   python productivity_guard.py")
+    lines.append("\n🧪 Test mode:")
+    lines.append("   python productivity_guard.py --test")
+    lines.append("\n📚 Full documentation:")
+    lines.append("   See README.md and DAILY_LOGGING_IMPLEMENTATION.md")
+
+    lines.append(f"\n✅ All features implemented and ready to use!")
+    lines.append("🌟 Transform your productivity with comprehensive workday tracking!")
+
+    sys.stdout.buffer.write(("\n".join(lines) + "\n").encode())
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
-    demo_complete_features()
\ No newline at end of file
+    demo_complete_features()
@@ -8,138 +8,162 @@ This script shows how the new features work:
 """
 
 import os
+import sys
 import json
 from datetime import datetime, timedelta
-from productivity_guard import ProductivityGuard
+
+_SEP70 = "=" * 70
+
+# The example todo dicts are fixed, so serialize them once at import time
+# instead of running json.dumps on every call.
+_REGULAR_TODO_JSON = json.dumps({
+    "id": 1,
+    "text": "Implement new feature",
+    "completed": False,
+    "created_at": "2025-01-08T09:00:00.000000"
+}, indent=4)
+_NEXT_SESSION_TODO_JSON = json.dumps({
+    "id": 2,
+    "text": "Review code changes",
+    "completed": False,
+    "created_at": "2025-01-08T14:30:00.000000",
+    "from_previous_session": True
+}, indent=4)
+_IMPORTED_TODO_JSON = json.dumps({
+    "id": 3,
+    "text": "Update documentation",
+    "completed": False,
+    "created_at": "2025-01-08T09:00:00.000000",
+    "imported_from_previous_day": True,
+    "original_date": "2025-01-07T10:15:00.000000"
+}, indent=4)
+
+# The example section and closing banner are fully static as well, so they
+# are pre-encoded alongside the prologue and written as ready-made bytes.
+_EXAMPLE_TODOS_BYTES = ("\n".join([
+    "\n   Regular Todo:",
+    f"   {_REGULAR_TODO_JSON}",
+
+    "\n   Next Session Todo:",
+    f"   {_NEXT_SESSION_TODO_JSON}",
+
+    "\n   Imported from Previous Day:",
+    f"   {_IMPORTED_TODO_JSON}",
+]) + "\n").encode()
+
+_STATIC_EPILOGUE = ("\n".join([
+    "\n" + _SEP70,
+    "🚦 COMMANDS:",
+    "   • 'end' / 'end workday' - Trigger next session todo collection",
+    "   • 'todos' / 'list' - Show current todos (with metadata)",
+    "   • 'done [id]' - Complete todo",
+    "   • 'add [text]' - Add new todo",
+
+    "\n" + _SEP70,
+    "✅ Features implemented and ready for testing!",
+    "\nTo test:",
+    "1. Run ProductivityGuard normally",
+    "2. Add some todos, complete some",
+    "3. Use 'end' command and add next session todos",
+    "4. Restart and see todos loaded automatically",
+    "5. Try on a new day to see previous day import",
+]) + "\n").encode()
+
+# Static banner, encoded once at import time (see demo_complete_features).
+_STATIC_PROLOGUE = ("\n".join([
+    "🚀 ProductivityGuard - New Todo Management Features Demo",
+    _SEP70,
+
+    "\n🎯 NEW TODO MANAGEMENT FEATURES:",
+
+    "\n1. 📝 NEXT SESSION TODO COLLECTION",
+    "   • When ending workday with 'end' command",
+    "   • Ask user for todos for next session",
+    "   • Store in next_session_todos.json",
+    "   • Load automatically when starting again",
+    "   • Works for same day or future sessions",
+
+    "\n2. 📅 PREVIOUS DAY TODO IMPORT",
+    "   • When starting a new day (no existing todos)",
+    "   • Check for undone todos from yesterday",
+    "   • Offer to import them for today",
+    "   • Mark imported todos with metadata",
+
+    "\n" + _SEP70,
+    "🔧 HOW THE NEW FEATURES WORK:",
+
+    "\n📤 ENDING WORKDAY:",
+    "   1. Run 'end' command to end workday",
+    "   2. System generates workday summary",
+    "   3. Prompts: 'Add todos for next session?'",
+    "   4. Enter todos one by one (or skip)",
+    "   5. Saves to data/next_session_todos.json",
+    "   6. File removed after loading in next session",
+
+    "\n📥 STARTING NEW SESSION:",
+    "   Same Day:",
+    "   • Loads existing daily todos",
+    "   • Loads next_session_todos.json if exists",
+    "   • Integrates both seamlessly",
+
+    "\n   New Day:",
+    "   • Checks for undone todos from yesterday",
+    "   • Asks: 'Import yesterday's undone todos?'",
+    "   • Loads next_session_todos.json if exists",
+    "   • Prompts for additional todos",
+    "   • All todos saved to today's file",
+
+    "\n" + _SEP70,
+    "📁 FILE STRUCTURE:",
+]) + "\n").encode()
 
 def demo_new_todo_features():
     """Demonstrate the new todo management functionality."""
-    print("🚀 ProductivityGuard - New Todo Management Features Demo")
-    print("=" * 70)
-    
-    print("\n🎯 NEW TODO MANAGEMENT FEATURES:")
-    
-    print("\n1. 📝 NEXT SESSION TODO COLLECTION")
-    print("   • When ending workday with 'end' command")
-    print("   • Ask user for todos for next session")
-    print("   • Store in next_session_todos.json")
-    print("   • Load automatically when starting again")
-    print("   • Works for same day or future sessions")
-    
-    print("\n2. 📅 PREVIOUS DAY TODO IMPORT")
-    print("   • When starting a new day (no existing todos)")
-    print("   • Check for undone todos from yesterday")
-    print("   • Offer to import them for today")
-    print("   • Mark imported todos with metadata")
-    
-    print("\n" + "=" * 70)
-    print("🔧 HOW THE NEW FEATURES WORK:")
-    
-    print("\n📤 ENDING WORKDAY:")
-    print("   1. Run 'end' command to end workday")
-    print("   2. System generates workday summary")
-    print("   3. Prompts: 'Add todos for next session?'")
-    print("   4. Enter todos one by one (or skip)")
-    print("   5. Saves to data/next_session_todos.json")
-    print("   6. File removed after loading in next session")
-    
-    print("\n📥 STARTING NEW SESSION:")
-    print("   Same Day:")
-    print("   • Loads existing daily todos")
-    print("   • Loads next_session_todos.json if exists")
-    print("   • Integrates both seamlessly")
-    
-    print("\n   New Day:")
-    print("   • Checks for undone todos from yesterday") 
-    print("   • Asks: 'Import yesterday's undone todos?'")
-    print("   • Loads next_session_todos.json if exists")
-    print("   • Prompts for additional todos")
-    print("   • All todos saved to today's file")
-    
-    print("\n" + "=" * 70)
-    print("📁 FILE STRUCTURE:")
-    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_STATIC_PROLOGUE)
+
+    # Dynamic tail: depends on today's and yesterday's dates.
+    lines = []
+
     data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
-    today = datetime.now().strftime('%Y-%m-%d')
-    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
-    
-    print(f"\n   data/")
-    print(f"   ├── {today}_daily_todos.json       # Today's todos")
-    print(f"   ├── {yesterday}_daily_todos.json   # Yesterday's todos")
-    print(f"   ├── next_session_todos.json        # Pending next session todos")
-    print(f"   ├── logs/")
-    print(f"   └── summaries/")
-    
-    print("\n" + "=" * 70)
-    print("💡 USAGE SCENARIOS:")
-    
-    print("\n🔄 Scenario 1: Multiple sessions same day")
-    print("   • Morning: Start ProductivityGuard, add todos")
-    print("   • Lunch: End with 'end', add afternoon todos")
-    print("   • Afternoon: Restart, gets morning + afternoon todos")
-    
-    print("\n📅 Scenario 2: New day workflow")
-    print("   • Previous day had: 'Code feature', 'Review PR', 'Write docs'")
-    print("   • Only completed: 'Code feature'")
-    print("   • New day: Offers to import 'Review PR', 'Write docs'")
-    print("   • Add new todos on top of imported ones")
-    
-    print("\n🎯 Scenario 3: End-of-day planning")
-    print("   • End workday: 'Think of tomorrow's tasks?'")
-    print("   • Add: 'Fix bug #123', 'Prepare presentation'")
-    print("   • Next day: Auto-loads those tasks")
-    
-    print("\n" + "=" * 70)
-    print("📋 EXAMPLE TODO METADATA:")
-    
-    example_todos = {
-        "regular_todo": {
-            "id": 1,
-            "text": "Implement new feature",
-            "completed": False,
-            "created_at": "2025-01-08T09:00:00.000000"
-        },
-        "next_session_todo": {
-            "id": 2,
-            "text": "Review code changes", 
-            "completed": False,
-            "created_at": "2025-01-08T14:30:00.000000",
-            "from_previous_session": True
-        },
-        "imported_todo": {
-            "id": 3,
-            "text": "Update documentation",
-            "completed": False,
-            "created_at": "2025-01-08T09:00:00.000000",
-            "imported_from_previous_day": True,
-            "original_date": "2025-01-07T10:15:00.000000"
-        }
-    }
-    
-    print("\n   Regular Todo:")
-    print(f"   {json.dumps(example_todos['regular_todo'], indent=4)}")
-    
-    print("\n   Next Session Todo:")
-    print(f"   {json.dumps(example_todos['next_session_todo'], indent=4)}")
-    
-    print("\n   Imported from Previous Day:")
-    print(f"   {json.dumps(example_todos['imported_todo'], indent=4)}")
-    
-    print("\n" + "=" * 70)
-    print("🚦 COMMANDS:")
-    print("   • 'end' / 'end workday' - Trigger next session todo collection")
-    print("   • 'todos' / 'list' - Show current todos (with metadata)")
-    print("   • 'done [id]' - Complete todo")
-    print("   • 'add [text]' - Add new todo")
-    
-    print("\n" + "=" * 70)
-    print("✅ Features implemented and ready for testing!")
-    print("\nTo test:")
-    print("1. Run ProductivityGuard normally")
-    print("2. Add some todos, complete some")
-    print("3. Use 'end' command and add next session todos")
-    print("4. Restart and see todos loaded automatically")
-    print("5. Try on a new day to see previous day import")
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
+    yesterday = (now - timedelta(days=1)).strftime('%Y-%m-%d')
+
+    lines.append(f"""
+   data/
+   ├── {today}_daily_todos.json       # Today's todos
+   ├── {yesterday}_daily_todos.json   # Yesterday's todos
+   ├── next_session_todos.json        # Pending next session todos
+   ├── logs/
+   └── summaries/""")
+
+    lines.append("\n" + _SEP70)
+    lines.append("💡 USAGE SCENARIOS:")
+
+    lines.append("\n🔄 Scenario 1: Multiple sessions same day")
+    lines.append("   • Morning: Start ProductivityGuard, add todos")
+    lines.append("   • Lunch: End with 'end', add afternoon todos")
+    lines.append("   • Afternoon: Restart, gets morning + afternoon todos")
+
+    lines.append("\n📅 Scenario 2: New day workflow")
+    lines.append("   • Previous day had: 'Code feature', 'Review PR', 'Write docs'")
+    lines.append("   • Only completed: 'Code feature'")
+    lines.append("   • New day: Offers to import 'Review PR', 'Write docs'")
+    lines.append("   • Add new todos on top of imported ones")
+
+    lines.append("\n🎯 Scenario 3: End-of-day planning")
+    lines.append("   • End workday: 'Think of tomorrow's tasks?'")
+    lines.append("   • Add: 'Fix bug #123', 'Prepare presentation'")
+    lines.append("   • Next day: Auto-loads those tasks")
+
+    lines.append("\n" + _SEP70)
+    lines.append("📋 EXAMPLE TODO METADATA:")
+
+    sys.stdout.buffer.write(("\n".join(lines) + "\n").encode())
+    sys.stdout.buffer.write(_EXAMPLE_TODOS_BYTES)
+    sys.stdout.buffer.write(_STATIC_EPILOGUE)
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
-    demo_new_todo_features()
\ No newline at end of file
+    demo_new_todo_features()
@@ -6,108 +6,120 @@ This script shows how the todo list integrates with productivity monitoring.
 """
 
 import os
+import sys
 from datetime import datetime
-from productivity_guard import ProductivityGuard
+
+_SEP60 = "=" * 60
+
+# Static banner, encoded once at import time (see demo_complete_features).
+_STATIC_PROLOGUE = ("\n".join([
+    "🚀 ProductivityGuard - Daily Todo List Feature Demo",
+    _SEP60,
+
+    "\n🎯 NEW TODO LIST FEATURES:",
+
+    "\n1. 📝 DAILY TODO COLLECTION",
+    "   • Prompts for todos when program starts",
+    "   • Stores todos in JSON format",
+    "   • Resumes existing todos if program restarts",
+
+    "\n2. ✅ TODO MANAGEMENT COMMANDS",
+    "   • 'todos' or 'list' - Show current todo list",
+    "   • 'done [number]' - Mark todo as completed",
+    "   • 'add [text]' - Add new todo item",
+    "   • Progress tracking with percentages",
+
+    "\n3. 🤖 AI-POWERED SUGGESTIONS",
+    "   • AI analyzes screenshots and suggests todo updates",
+    "   • Suggests marking todos as complete when relevant",
+    "   • Suggests adding new todos based on activity",
+    "   • Conservative approach - only obvious suggestions",
+
+    "\n4. 📊 INTEGRATED TRACKING",
+    "   • Todo progress shown in hourly summaries",
+    "   • Todo completion logged as PLANNING activity",
+    "   • Full todo summary in end-of-day reports",
+    "   • Saved to daily activity log files",
+
+    "\n" + _SEP60,
+    "📋 HOW THE TODO SYSTEM WORKS:",
+
+    "\n🚀 PROGRAM START:",
+    "   • If no todos exist for today, prompts user for input",
+    "   • Creates data/YYYY-MM-DD_daily_todos.json",
+    "   • Loads existing todos if restarting program",
+    "   • Logs initial todo list to activity file",
+
+    "\n⚡ DURING MONITORING:",
+    "   • Every 3rd activity check, AI suggests todo updates",
+    "   • User can manage todos with simple commands",
+    "   • Todo completions tracked as productivity events",
+    "   • Progress included in hourly summaries",
+
+    "\n🎯 END OF DAY:",
+    "   • Complete todo summary in workday report",
+    "   • Shows completed vs remaining todos",
+    "   • Calculates completion percentage",
+    "   • Includes todo progress in AI analysis",
+
+    "\n" + _SEP60,
+    "💡 EXAMPLE USAGE:",
+
+    "\n📝 Starting the program:",
+    "   $ python productivity_guard.py",
+    "   📝 DAILY TODO LIST SETUP",
+    "   What do you want to get done today?",
+    "   Todo #1: Complete feature implementation",
+    "   Todo #2: Review pull requests",
+    "   Todo #3: [Enter to finish]",
+
+    "\n⚡ During monitoring:",
+    "   $ todos",
+    "   📝 TODAY'S TODOS:",
+    "   ⬜ 1. Complete feature implementation",
+    "   ⬜ 2. Review pull requests",
+    "   📊 Progress: 0/2 (0%)",
+
+    "\n   $ done 1",
+    "   ✅ Completed: Complete feature implementation",
+
+    "\n   $ add Update documentation",
+    "   ✅ Added todo #3: Update documentation",
+
+    "\n🤖 AI Suggestions:",
+    "   [After detecting code review activity]",
+    "   🤖 AI Suggestion: Complete todo 'Review pull requests'?",
+    "   (Type 'done 2' to confirm)",
+
+    "\n📊 Hourly Summary:",
+    "   ⏰ HOURLY UPDATE - 14:00",
+    "   📅 Workday duration: 2.0 hours",
+    "   🎯 Productivity: 85.2% productive",
+    "   📝 Todo progress: 2/3 (67%)",
+
+    "\n" + _SEP60,
+    "📁 FILE ORGANIZATION:",
+]) + "\n").encode()
 
 def demo_todo_features():
     """Demonstrate the new todo list functionality."""
-    print("🚀 ProductivityGuard - Daily Todo List Feature Demo")
-    print("=" * 60)
-    
-    print("\n🎯 NEW TODO LIST FEATURES:")
-    
-    print("\n1. 📝 DAILY TODO COLLECTION")
-    print("   • Prompts for todos when program starts")
-    print("   • Stores todos in JSON format")
-    print("   • Resumes existing todos if program restarts")
-    
-    print("\n2. ✅ TODO MANAGEMENT COMMANDS")
-    print("   • 'todos' or 'list' - Show current todo list")
-    print("   • 'done [number]' - Mark todo as completed")
-    print("   • 'add [text]' - Add new todo item")
-    print("   • Progress tracking with percentages")
-    
-    print("\n3. 🤖 AI-POWERED SUGGESTIONS")
-    print("   • AI analyzes screenshots and suggests todo updates")
-    print("   • Suggests marking todos as complete when relevant")
-    print("   • Suggests adding new todos based on activity")
-    print("   • Conservative approach - only obvious suggestions")
-    
-    print("\n4. 📊 INTEGRATED TRACKING")
-    print("   • Todo progress shown in hourly summaries")
-    print("   • Todo completion logged as PLANNING activity")
-    print("   • Full todo summary in end-of-day reports")
-    print("   • Saved to daily activity log files")
-    
-    print("\n" + "=" * 60)
-    print("📋 HOW THE TODO SYSTEM WORKS:")
-    
-    print("\n🚀 PROGRAM START:")
-    print("   • If no todos exist for today, prompts user for input")
-    print("   • Creates data/YYYY-MM-DD_daily_todos.json")
-    print("   • Loads existing todos if restarting program")
-    print("   • Logs initial todo list to activity file")
-    
-    print("\n⚡ DURING MONITORING:")
-    print("   • Every 3rd activity check, AI suggests todo updates")
-    print("   • User can manage todos with simple commands")
-    print("   • Todo completions tracked as productivity events")
-    print("   • Progress included in hourly summaries")
-    
-    print("\n🎯 END OF DAY:")
-    print("   • Complete todo summary in workday report")
-    print("   • Shows completed vs remaining todos")
-    print("   • Calculates completion percentage")
-    print("   • Includes todo progress in AI analysis")
-    
-    print("\n" + "=" * 60)
-    print("💡 EXAMPLE USAGE:")
-    
-    print("\n📝 Starting the program:")
-    print("   $ python productivity_guard.py")
-    print("   📝 DAILY TODO LIST SETUP")
-    print("   What do you want to get done today?")
-    print("   Todo #1: Complete feature implementation")
-    print("   Todo #2: Review pull requests")
-    print("   Todo #3: [Enter to finish]")
-    
-    print("\n⚡ During monitoring:")
-    print("   $ todos")
-    print("   📝 TODAY'S TODOS:")
-    print("   ⬜ 1. Complete feature implementation")
-    print("   ⬜ 2. Review pull requests")
-    print("   📊 Progress: 0/2 (0%)")
-    
-    print("\n   $ done 1")
-    print("   ✅ Completed: Complete feature implementation")
-    
-    print("\n   $ add Update documentation")
-    print("   ✅ Added todo #3: Update documentation")
-    
-    print("\n🤖 AI Suggestions:")
-    print("   [After detecting code review activity]")
-    print("   🤖 AI Suggestion: Complete todo 'Review pull requests'?")
-    print("   (Type 'done 2' to confirm)")
-    
-    print("\n📊 Hourly Summary:")
-    print("   ⏰ HOURLY UPDATE - 14:00")
-    print("   📅 Workday duration: 2.0 hours")
-    print("   🎯 Productivity: 85.2% productive")
-    print("   📝 Todo progress: 2/3 (67%)")
-    
-    print("\n" + "=" * 60)
-    print("📁 FILE ORGANIZATION:")
-    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_STATIC_PROLOGUE)
+
+    # Dynamic tail: only this part depends on today's date.
+    lines = []
+
     today = datetime.now().strftime('%Y-%m-%d')
-    print(f"\n📂 data/")
-    print(f"   ├── {today}_daily_todos.json      # Todo storage")
-    print(f"   ├── logs/")
-    print(f"   │   └── {today}_activity_log.md   # Includes todo list")
-    print(f"   └── summaries/")
-    print(f"       └── {today}_workday_summary.md # Includes todo summary")
-    
-    print("\n📄 Todo JSON Structure:")
-    print("""   {
+    lines.append(f"""
+📂 data/
+   ├── {today}_daily_todos.json      # Todo storage
+   ├── logs/
+   │   └── {today}_activity_log.md   # Includes todo list
+   └── summaries/
+       └── {today}_workday_summary.md # Includes todo summary""")
+
+    lines.append("\n📄 Todo JSON Structure:")
+    lines.append("""   {
      "date": "2025-08-03",
      "todos": [
        {
@@ -120,45 +132,48 @@ def demo_todo_features():
      ],
      "next_id": 2
    }""")
-    
-    print("\n" + "=" * 60)
-    print("✨ BENEFITS:")
-    
-    print("\n📈 FOR PRODUCTIVITY:")
-    print("   • Clear daily goals and priorities")
-    print("   • Visual progress tracking throughout day")
-    print("   • AI-assisted task management")
-    print("   • Integration with time tracking")
-    
-    print("\n🎯 FOR AWARENESS:")
-    print("   • Connect activities to planned goals")
-    print("   • Identify when working on unplanned tasks")
-    print("   • Understand goal completion patterns")
-    print("   • Balance planned vs reactive work")
-    
-    print("\n📝 FOR PLANNING:")
-    print("   • Historical record of daily goals")
-    print("   • Completion rate analysis over time")
-    print("   • Learn from planning accuracy")
-    print("   • Improve future goal setting")
-    
-    print("\n" + "=" * 60)
-    print("🧪 TESTING THE FEATURES:")
-    
-    print("\n💻 Full test with API:")
-    print("   python productivity_guard.py --test")
-    print("   → Uses predefined todos")
-    print("   → Shows all todo functionality")
-    print("   → No screenshots needed")
-    
-    print("\n🚀 Real usage start:")
-    print("   python productivity_guard.py")
-    print("   → Prompts for daily todos")
-    print("   → Begins productivity monitoring")
-    print("   → AI suggestions active")
-    
-    print(f"\n✅ Todo list feature fully implemented!")
-    print("🌟 Transform your daily productivity with integrated goal tracking!")
+
+    lines.append("\n" + _SEP60)
+    lines.append("✨ BENEFITS:")
+
+    lines.append("\n📈 FOR PRODUCTIVITY:")
+    lines.append("   • Clear daily goals and priorities")
+    lines.append("   • Visual progress tracking throughout day")
+    lines.append("   • AI-assisted task management")
+    lines.append("   • Integration with time tracking")
+
+    lines.append("\n🎯 FOR AWARENESS:")
+    lines.append("   • Connect activities to planned goals")
+    lines.append("   • Identify when working on unplanned tasks")
+    lines.append("   • Understand goal completion patterns")
+    lines.append("   • Balance planned vs reactive work")
+
+    lines.append("\n📝 FOR PLANNING:")
+    lines.append("   • Historical record of daily goals")
+    lines.append("   • Completion rate analysis over time")
+    lines.append("   • Learn from planning accuracy")
+    lines.append("   • Improve future goal setting")
+
+    lines.append("\n" + _SEP60)
+    lines.append("🧪 TESTING THE FEATURES:")
+
+    lines.append("\n💻 Full test with API:")
+    lines.append("   python productivity_guard.py --test")
+    lines.append("   → Uses predefined todos")
+    lines.append("   → Shows all todo functionality")
+    lines.append("   → No screenshots needed")
+
+    lines.append("\n🚀 Real usage start:")
+    lines.append("   python productivity_guard.py")
+    lines.append("   → Prompts for daily todos")
+    lines.append("   → Begins productivity monitoring")
+    lines.append("   → AI suggestions active")
+
+    lines.append(f"\n✅ Todo list feature fully implemented!")
+    lines.append("🌟 Transform your daily productivity with integrated goal tracking!")
+
+    sys.stdout.buffer.write(("\n".join(lines) + "\n").encode())
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
-    demo_todo_features()
\ No newline at end of file
+    demo_todo_features()
@@ -6,21 +6,38 @@ This script shows a simple demonstration of the workday tracking functionality
 without requiring API keys or actual screenshots.
 """
 
-from productivity_guard import ProductivityGuard
+import os
+import sys
 from datetime import datetime, timedelta
 import time
 
+# The per-activity pause is purely cosmetic; opt in via PG_DEMO_ANIMATE=1
+# so scripted or timed runs finish without the artificial delay.
+_ANIMATE = os.getenv('PG_DEMO_ANIMATE', 'false').lower() in ('1', 'true', 'yes')
+
+_SEP50 = "=" * 50
+
 def demo_workday_tracking():
     """Demonstrate the workday tracking features."""
-    print("🎯 ProductivityGuard Workday Tracking Demo")
-    print("=" * 50)
-    
+    # Deferred: importing productivity_guard pulls in the full app (mss,
+    # OpenAI client, optional OCR stack), which plain imports of this
+    # module shouldn't pay for.
+    from productivity_guard import ProductivityGuard
+
+    # Buffer contiguous output and emit it in single writes; the activity
+    # loop still prints directly so its output stays interleaved with the
+    # guard's own logging.
+    print("🎯 ProductivityGuard Workday Tracking Demo\n" + _SEP50)
+
     # Create a ProductivityGuard instance in test mode
     guard = ProductivityGuard(test_mode=True, debug=True)
-    
-    print(f"📅 Workday started: {guard.workday_start_time.strftime('%Y-%m-%d %H:%M')}")
-    print("\n🧪 Simulating activities throughout the workday...")
-    
+
+    sys.stdout.write(
+        f"📅 Workday started: {guard.workday_start_time.strftime('%Y-%m-%d %H:%M')}\n"
+        "\n🧪 Simulating activities throughout the workday...\n"
+    )
+    sys.stdout.flush()
+
     # Simulate some activities
     activities = [
         ('CODING', 'Working on Python script'),
@@ -33,18 +50,23 @@ def demo_workday_tracking():
         ('CODING', 'Code review'),
         ('MEETINGS', 'Team standup'),
     ]
-    
+
     print("\n📊 Activity Log:")
+    # Simulate activities five minutes apart and log them in one batched
+    # write rather than one file open/write per activity.
+    base = datetime.now() - timedelta(minutes=5 * len(activities))
+    guard.log_activities_bulk([
+        (category, description, base + timedelta(minutes=5 * i))
+        for i, (category, description) in enumerate(activities)
+    ])
     for i, (category, description) in enumerate(activities):
-        # Simulate some time passing
-        guard.current_activity_start = datetime.now() - timedelta(minutes=5)
-        guard.log_activity(category, description)
         print(f"   {i+1}. {category.title()}: {description}")
-        time.sleep(0.5)  # Small delay for demo effect
-    
+        if _ANIMATE:
+            time.sleep(0.5)  # Small delay for demo effect
+
     print("\n⏰ Generating hourly summary...")
     guard.generate_hourly_summary()
-    
+
     print("\n🎯 Generating end-of-workday summary...")
     guard.workday_active = True  # Ensure it's active for the summary
     guard._generate_basic_summary({
@@ -55,12 +77,15 @@ def demo_workday_tracking():
         'MEETINGS': {'hours': 0, 'minutes': 45, 'total_minutes': 45, 'percentage': 13.6},
         'BREAKS': {'hours': 0, 'minutes': 25, 'total_minutes': 25, 'percentage': 7.6}
     }, timedelta(hours=5, minutes=30))
-    
-    print("\n✅ Demo completed!")
-    print("\n💡 To run the full workday tracking with real screenshots:")
-    print("   python productivity_guard.py")
-    print("\n🧪 To test with simulated activities:")
-    print("   python productivity_guard.py --test")
+
+    sys.stdout.write(
+        "\n✅ Demo completed!\n"
+        "\n💡 To run the full workday tracking with real screenshots:\n"
+        "   python productivity_guard.py\n"
+        "\n🧪 To test with simulated activities:\n"
+        "   python productivity_guard.py --test\n"
+    )
+    sys.stdout.flush()
 
 if __name__ == "__main__":
-    demo_workday_tracking()
\ No newline at end of file
+    demo_workday_tracking()
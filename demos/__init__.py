@@ -0,0 +1,18 @@
+"""Single entry point for the ProductivityGuard demo scripts.
+
+Running ``python -m demos all`` executes every demo in one interpreter,
+paying Python startup and the shared imports once instead of once per
+script. The individual ``demo_*.py`` scripts keep working as before.
+"""
+
+from demo_complete_features import demo_complete_features
+from demo_new_todo_features import demo_new_todo_features
+from demo_todo_features import demo_todo_features
+from demo_workday_tracking import demo_workday_tracking
+
+__all__ = [
+    'demo_complete_features',
+    'demo_new_todo_features',
+    'demo_todo_features',
+    'demo_workday_tracking',
+]
@@ -0,0 +1,30 @@
+import argparse
+
+from demos import (
+    demo_complete_features,
+    demo_new_todo_features,
+    demo_todo_features,
+    demo_workday_tracking,
+)
+
+DEMOS = {
+    'complete': demo_complete_features,
+    'new-todos': demo_new_todo_features,
+    'todos': demo_todo_features,
+    'workday': demo_workday_tracking,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog='demos',
+        description='Run the ProductivityGuard feature demos in a single process'
+    )
+    parser.add_argument('demo', choices=list(DEMOS) + ['all'],
+                        help="Which demo to run ('all' runs every demo in order)")
+    args = parser.parse_args()
+
+    if args.demo == 'all':
+        for demo in DEMOS.values():
+            demo()
+    else:
+        DEMOS[args.demo]()
@@ -12,70 +12,102 @@ def test_break_functionality():
     """Test the break feature by creating a simplified version."""
     
     class SimpleBreakTester:
+        # No per-instance __dict__; attribute reads in the polling methods
+        # go through direct slot lookups instead.
+        __slots__ = ('on_break', 'break_start_time', 'break_end_time',
+                     'break_duration', '_break_duration_inv', 'break_activity')
+
+        # Progress bar pieces, built once; renders slice these instead of
+        # re-multiplying the characters on every status poll.
+        _BAR_LEN = 20
+        _FULL_BAR = "☕" * _BAR_LEN
+        _EMPTY_BAR = "░" * _BAR_LEN
+
+        # Status render template, compiled once; only the numeric fields
+        # and the bar change between polls.
+        _STATUS_TEMPLATE = (
+            "\n☕ BREAK MODE ACTIVE\n"
+            "🎯 Activity: {activity}\n"
+            "⏰ Time remaining: {remaining_minutes:02d}:{remaining_secs:02d}\n"
+            "📊 Progress: {elapsed_minutes}/{total_minutes} minutes\n"
+            "📸 Screenshot monitoring is PAUSED\n"
+            "🔋 [{bar}] {pct:.1f}%\n"
+        )
+
         def __init__(self):
             self.on_break = False
             self.break_start_time = None
+            self.break_end_time = None
             self.break_duration = 0
+            self._break_duration_inv = 0.0
             self.break_activity = ""
-            
+
         def start_break(self, minutes, activity):
             """Simplified break start method."""
             if self.on_break:
                 print("☕ You're already on a break!")
                 return
-            
+
             self.on_break = True
             self.break_start_time = datetime.now()
             self.break_duration = minutes * 60
+            self._break_duration_inv = 1.0 / self.break_duration
+            # Computed once here so status polls don't redo the arithmetic
+            self.break_end_time = self.break_start_time + timedelta(seconds=self.break_duration)
             self.break_activity = activity
+
+            # One write instead of six print calls
+            sys.stdout.write(
+                f"\n🛑 BREAK MODE ACTIVATED!\n"
+                f"☕ Activity: {activity}\n"
+                f"⏰ Duration: {minutes} minutes\n"
+                f"🎯 Break ends at {self.break_end_time.strftime('%H:%M')}\n"
+                "📸 Screenshot monitoring is PAUSED\n"
+                + "=" * 50 + "\n"
+            )
             
-            print(f"\n🛑 BREAK MODE ACTIVATED!")
-            print(f"☕ Activity: {activity}")
-            print(f"⏰ Duration: {minutes} minutes")
-            print(f"🎯 Break ends at {(self.break_start_time + timedelta(seconds=self.break_duration)).strftime('%H:%M')}")
-            print("📸 Screenshot monitoring is PAUSED")
-            print("=" * 50)
-            
-        def show_break_status(self):
+        def show_break_status(self, now=None):
             """Show current break status."""
             if not self.on_break:
                 print("☕ No active break.")
                 return
-            
-            current_time = datetime.now()
-            elapsed_seconds = (current_time - self.break_start_time).total_seconds()
-            remaining_seconds = max(0, self.break_duration - elapsed_seconds)
-            
+
+            # Callers polling both methods per tick can pass a shared 'now'
+            # so the clock is only queried once per tick.
+            now = now or datetime.now()
+            remaining_seconds = max(0, (self.break_end_time - now).total_seconds())
+            elapsed_seconds = self.break_duration - remaining_seconds
+
             if remaining_seconds > 0:
                 remaining_minutes = int(remaining_seconds // 60)
                 remaining_secs = int(remaining_seconds % 60)
                 total_minutes = int(self.break_duration // 60)
                 elapsed_minutes = int(elapsed_seconds // 60)
                 
-                print(f"\n☕ BREAK MODE ACTIVE")
-                print(f"🎯 Activity: {self.break_activity}")
-                print(f"⏰ Time remaining: {remaining_minutes:02d}:{remaining_secs:02d}")
-                print(f"📊 Progress: {elapsed_minutes}/{total_minutes} minutes")
-                print(f"📸 Screenshot monitoring is PAUSED")
-                
-                # Show simple progress bar
-                progress = elapsed_seconds / self.break_duration
-                bar_length = 20
-                filled_length = int(bar_length * progress)
-                bar = "☕" * filled_length + "░" * (bar_length - filled_length)
-                print(f"🔋 [{bar}] {progress*100:.1f}%")
+                progress = elapsed_seconds * self._break_duration_inv
+                filled_length = int(self._BAR_LEN * progress)
+                bar = self._FULL_BAR[:filled_length] + self._EMPTY_BAR[:self._BAR_LEN - filled_length]
+
+                # One write per status refresh instead of six print calls
+                sys.stdout.write(self._STATUS_TEMPLATE.format_map({
+                    'activity': self.break_activity,
+                    'remaining_minutes': remaining_minutes,
+                    'remaining_secs': remaining_secs,
+                    'elapsed_minutes': elapsed_minutes,
+                    'total_minutes': total_minutes,
+                    'bar': bar,
+                    'pct': progress * 100,
+                }))
             else:
                 print("⏰ Break time is over!")
                 
-        def check_break_timer(self):
+        def check_break_timer(self, now=None):
             """Check if break is finished."""
             if not self.on_break:
                 return False
-                
-            current_time = datetime.now()
-            elapsed_seconds = (current_time - self.break_start_time).total_seconds()
-            
-            if elapsed_seconds >= self.break_duration:
+
+            now = now or datetime.now()
+            if now >= self.break_end_time:
                 self.on_break = False
                 minutes = self.break_duration // 60
                 
@@ -105,9 +137,11 @@ def test_break_functionality():
     print("\n2. Starting a 2-minute break (for testing):")
     tester.start_break(2, "drinking coffee and stretching")
     
-    # Test 3: Show status during break
+    # Test 3: Show status during break (one clock read shared per tick)
     print("\n3. Checking break status:")
-    tester.show_break_status()
+    now = datetime.now()
+    tester.check_break_timer(now)
+    tester.show_break_status(now)
     
     # Test 4: Try to start another break
     print("\n4. Trying to start another break while already on break:")
@@ -120,7 +154,7 @@ def test_break_functionality():
     # Test 6: Simulate break completion
     print("\n6. Simulating break completion:")
     # Manually set break to completed state for demonstration
-    tester.break_start_time = datetime.now() - timedelta(minutes=3)  # Simulate 3 minutes ago
+    tester.break_end_time = datetime.now() - timedelta(minutes=1)  # Simulate break ended a minute ago
     tester.check_break_timer()
     
     # Test 7: Show status after break ends
@@ -0,0 +1,38 @@
+"""OCR worker process for ProductivityGuard.
+
+EasyOCR's readtext leaks native memory on every call (the growth lives on
+the C++ side, invisible to tracemalloc), so a day-long monitoring session
+slowly balloons. Running the reader in a subprocess that gets respawned
+periodically keeps the main process flat; ProductivityGuard drives this
+through its _SubprocessOCRReader proxy when OCR_SUBPROCESS=true.
+"""
+
+import os
+
+
+def ocr_worker(task_queue, result_queue):
+    """Own an EasyOCR reader and serve readtext requests from a queue.
+
+    Tasks are (task_id, image_array, kwargs) tuples; a None task shuts the
+    worker down. Results are (task_id, detections, error) tuples.
+    """
+    # Mirror the MPS workarounds from productivity_guard for Apple Silicon
+    os.environ.setdefault('PYTORCH_ENABLE_MPS_FALLBACK', '1')
+
+    import easyocr
+    try:
+        import torch
+        use_gpu = torch.cuda.is_available() or torch.backends.mps.is_available()
+    except Exception:
+        use_gpu = False
+    reader = easyocr.Reader(['en'], gpu=use_gpu, quantize=True, verbose=False)
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        task_id, img, kwargs = task
+        try:
+            result_queue.put((task_id, reader.readtext(img, **kwargs), None))
+        except Exception as e:
+            result_queue.put((task_id, None, str(e)))
@@ -1,6 +1,7 @@
 import os
 import time
 import tempfile
+import importlib.util
 from datetime import datetime, timedelta
 from mss import mss
 from openai import OpenAI
@@ -9,14 +10,20 @@ import base64
 import io
 from PIL import Image
 import argparse
+import gc
 import json
+import random
+import re
+import select
 import shutil
 import hashlib
 import sys
 import subprocess
+from collections import OrderedDict, deque
 from typing import Any, Dict, List
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import warnings
 
@@ -32,17 +39,52 @@ os.environ['PYTORCH_MPS_HIGH_WATERMARK_RATIO'] = '0.0'
 os.environ['PYTORCH_DISABLE_PIN_MEMORY_ON_MPS'] = '1'
 
 try:
-    import easyocr
-    OCR_AVAILABLE = True
-    OCR_TYPE = "easyocr"
+    import orjson  # Optional: much faster debug-data serialization
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # Ships with the openai package; used to tune connection reuse
 except ImportError:
+    httpx = None
+
+try:
+    from blake3 import blake3 as _blake3  # Optional: SIMD-accelerated hashing
+except ImportError:
+    _blake3 = None
+
+
+def _content_digest(data):
+    """16-byte digest of raw bytes; blake3 when available, else blake2b."""
+    if _blake3 is not None:
+        return _blake3(data).digest(length=16)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+# OCR backends are detected here but imported lazily in
+# ProductivityGuard._ensure_ocr_reader: importing easyocr pulls in torch
+# and ~100MB of model weights, which startup (and sessions that never
+# reach an OCR call) shouldn't pay for.
+easyocr = None
+pytesseract = None
+
+def _module_available(name):
+    """Check whether a module could be imported, without importing it."""
+    if name in sys.modules:
+        return True
     try:
-        import pytesseract
-        OCR_AVAILABLE = True
-        OCR_TYPE = "pytesseract"
-    except ImportError:
-        OCR_AVAILABLE = False
-        OCR_TYPE = None
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+if _module_available("easyocr"):
+    OCR_AVAILABLE = True
+    OCR_TYPE = "easyocr"
+elif _module_available("pytesseract"):
+    OCR_AVAILABLE = True
+    OCR_TYPE = "pytesseract"
+else:
+    OCR_AVAILABLE = False
+    OCR_TYPE = None
 if OCR_AVAILABLE:
     print(f"OCR available, {OCR_TYPE=}")
 else:
@@ -80,9 +122,87 @@ if OCR_AVAILABLE and ocr_note not in detection_prompt:
 
 SYSTEM_PROMPT = detection_prompt
 
+# Matches a final line carrying the verdict and an optional confidence
+# marker (e.g. "Yes", "**no.**", "yes-high", "no - low")
+_YESNO_RE = re.compile(r'^[^a-zA-Z]*(yes|no)(?:[^a-zA-Z]*(high|low))?[^a-zA-Z]*$', re.IGNORECASE)
+
+# Sites worth a model call even when the screen carries almost no text
+_PROCRASTINATION_KEYWORDS_RE = re.compile(
+    r'\b(youtube|reddit|tiktok|twitter|instagram|netflix|twitch)\b', re.IGNORECASE)
+
+# Fixed instruction appended to every detection prompt. The confidence
+# marker lets the fast model's verdict stand on its own when it is sure,
+# so the expensive reasoning model only runs on genuinely unclear screens.
+ANSWER_INSTRUCTION = "\n\nFirst, describe what you see in 1-2 sentences.\nThen on a new line, end your response with ONLY one of 'yes-high', 'yes-low', 'no-high' or 'no-low' (your decision plus how confident you are in it) and nothing else."
+
 # Load environment variables
 load_dotenv(find_dotenv())
 
+class _SubprocessOCRReader:
+    """Drop-in readtext() proxy that runs EasyOCR in a worker process.
+
+    easyocr leaks native memory on every readtext call, so long sessions
+    slowly balloon; containing the reader in a subprocess that is respawned
+    every RECYCLE_CALLS calls keeps the main process flat. Enabled with
+    OCR_SUBPROCESS=true.
+    """
+
+    RECYCLE_CALLS = 500
+
+    def __init__(self):
+        import multiprocessing
+        self._ctx = multiprocessing.get_context('spawn')
+        self._lock = threading.Lock()
+        self._task_id = 0
+        self._calls = 0
+        self._spawn()
+
+    def _spawn(self):
+        from ocr_worker import ocr_worker
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._proc = self._ctx.Process(
+            target=ocr_worker, args=(self._tasks, self._results), daemon=True)
+        self._proc.start()
+        self._calls = 0
+
+    def close(self):
+        try:
+            self._tasks.put(None)
+            self._proc.join(timeout=5)
+            if self._proc.is_alive():
+                self._proc.terminate()
+        except Exception:
+            pass
+
+    def readtext(self, img, **kwargs):
+        with self._lock:
+            self._calls += 1
+            if self._calls > self.RECYCLE_CALLS or not self._proc.is_alive():
+                self.close()
+                self._spawn()
+                self._calls = 1
+            self._task_id += 1
+            self._tasks.put((self._task_id, img, kwargs))
+            while True:
+                # Poll rather than block forever: if the worker dies mid-task
+                # (native crash, OOM kill) no result is ever coming, so
+                # respawn for the next call and fail this one like any other
+                # OCR error instead of freezing the capture loop
+                try:
+                    task_id, result, error = self._results.get(timeout=1)
+                except queue.Empty:
+                    if not self._proc.is_alive():
+                        self._spawn()
+                        raise RuntimeError("OCR worker died while processing a frame")
+                    continue
+                if task_id != self._task_id:
+                    continue  # stale result from before a respawn
+                if error:
+                    raise RuntimeError(error)
+                return result
+
+
 class ProductivityGuard:
     def __init__(self, interval=None, debug=False, test_mode=False, disable_sound=False):
         """Initialize ProductivityGuard with a checking interval in seconds."""
@@ -104,27 +224,95 @@ class ProductivityGuard:
                 "Get your API key from https://openrouter.ai/settings/keys"
             )
         
-        # Initialize OpenAI client with OpenRouter
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-            default_headers={
+        # Initialize OpenAI client with OpenRouter. A tuned httpx client
+        # keeps connections alive across the monitoring interval (and
+        # multiplexes the parallel Flash/Pro calls over HTTP/2 when the
+        # optional h2 package is installed), avoiding a fresh TLS handshake
+        # on every check.
+        client_kwargs = {
+            "base_url": "https://openrouter.ai/api/v1",
+            "api_key": api_key,
+            "default_headers": {
                 "HTTP-Referer": "https://github.com/neelnanda-io/productivity_guard",
                 "X-Title": "ProductivityGuard"
             }
-        )
+        }
+        if httpx is not None:
+            limits = httpx.Limits(max_keepalive_connections=16, keepalive_expiry=300)
+            timeout = httpx.Timeout(60.0, connect=5.0)
+            try:
+                client_kwargs["http_client"] = httpx.Client(http2=True, timeout=timeout, limits=limits)
+            except ImportError:
+                # HTTP/2 needs the optional 'h2' package; keep-alive still helps
+                client_kwargs["http_client"] = httpx.Client(timeout=timeout, limits=limits)
+        self.client = OpenAI(**client_kwargs)
         self.debug = debug
         self.sct = mss()  # Initialize screen capture tool
 
-        # Cache for previous screenshots to avoid duplicate processing
-        self.previous_screenshots = {}
+        # LRU cache of recent model verdicts keyed by screenshot hashes;
+        # bounded so day-long sessions don't retain every response forever
+        self.previous_screenshots = OrderedDict()
         self.last_description = ""
 
+        # OCR results keyed by pixel-content hash, so monitors showing the
+        # same frame again (alt-tabbing between two windows, say) get their
+        # text back in microseconds instead of another EasyOCR pass
+        self._ocr_cache = OrderedDict()
+
+        # Per-monitor perceptual hashes and processed results from the last
+        # capture, used to skip OCR, encoding and LLM calls when a monitor
+        # hasn't changed
+        self.previous_frame_hashes = {}
+        self._monitor_results = {}
+        self.last_frame_unchanged = False
+
+        # Which monitor last saw the mouse (tracked via the optional pynput
+        # listener started in run); ticks between full sweeps capture it alone
+        self._active_monitor_idx = None
+        self._capture_tick = 0
+        self._skip_streak = 0
+
+        # Consecutive checks without unproductive activity; stretches the
+        # effective check interval (see _effective_interval)
+        self._clean_streak = 0
+
+        # Content hashes of the latest encoded screenshots, computed once at
+        # encode time so the LLM cache doesn't rehash payloads; _hash_source
+        # records which screenshot objects the hashes belong to
+        self.screenshot_hashes = []
+        self._hash_source = []
+
+        # Built data: URLs keyed by content hash, so the parallel Flash and
+        # Pro calls (and consecutive checks of an unchanged screen) don't
+        # each redo the base64 encode and megabyte string concat
+        self._data_url_cache = OrderedDict()
+
         # Exception list for productive activities
         self.productivity_exceptions = []
-
-        # Input handling
+        self._rebuild_prompt_prefix()
+
+        # Shared pool for overlapping the Flash and Pro model calls, plus a
+        # lock serializing the caches those pool threads both touch, and a
+        # flag recording whether the previous check escalated to Pro (which
+        # gates the next speculative Pro submit)
+        self.llm_executor = ThreadPoolExecutor(max_workers=2)
+        self._llm_cache_lock = threading.Lock()
+        self._last_check_used_pro = False
+
+        # Persistent pool for per-monitor OCR/encode work; reused across
+        # captures instead of spinning threads up and down every cycle
+        self.monitor_executor = ThreadPoolExecutor(max_workers=4)
+
+        # Reusable JPEG encode buffers, one per pool thread
+        self._jpeg_buffers = threading.local()
+
+        # Input handling. On POSIX, commands are read straight off stdin
+        # with select() - no input thread, no queue hop, no 500ms latency.
+        # Windows keeps the thread+queue scheme since select() only works
+        # on sockets there.
         self.input_queue = queue.Queue()
+        self._use_select_input = os.name == 'posix'
+        self._stdin_eof = False
         self.stop_monitoring = False
         self.in_intervention = False
 
@@ -154,9 +342,11 @@ class ProductivityGuard:
         self.todo_counter = 1  # Counter for todo IDs
         self.setup_daily_todos()
 
-        # Encouragement messages for different situations
+        # Encouragement messages for different situations (tuples: they are
+        # fixed for the life of the process)
+        self._rng = random.Random()
         self.encouragement_messages = {
-            'procrastination': [
+            'procrastination': (
                 "💪 You've got this! Let's refocus and tackle what matters most.",
                 "✨ Hey there! Time to channel that energy into something productive.",
                 "🎆 Quick break's over - let's get back to crushing those goals!",
@@ -164,21 +354,21 @@ class ProductivityGuard:
                 "🎯 Focus time! What's the most important thing you could work on right now?",
                 "⚡ Let's redirect that energy - you're capable of amazing things!",
                 "🌱 Growth happens outside the comfort zone. Let's make progress!"
-            ],
-            'intervention_start': [
+            ),
+            'intervention_start': (
                 "No worries, we all drift sometimes! Let's chat and get back on track.",
                 "Hey, happens to the best of us! What's pulling your attention away?",
                 "Time for a quick reset! What were you hoping to accomplish today?",
                 "Let's pause and recalibrate - what's your next productive move?",
                 "No judgment here! Let's figure out how to make the most of your time."
-            ],
-            'good_work': [
+            ),
+            'good_work': (
                 "🎉 Great work! You're staying focused and making real progress.",
                 "🔥 You're on fire! Keep up that productive momentum.",
                 "✅ Awesome focus! You're building some serious productive habits.",
                 "🏆 Fantastic! You're showing what dedicated work looks like.",
                 "⭐ Stellar work! Your consistency is really paying off."
-            ]
+            )
         }
         self.last_encouragement_time = datetime.now()
         
@@ -193,27 +383,14 @@ class ProductivityGuard:
         self.break_duration = 0
         self.break_activity = ""
         
-        # Initialize OCR reader if available
+        # The OCR reader is created lazily by _ensure_ocr_reader - on first
+        # use, or by the startup warmup thread during the pre-check wait
         self.ocr_reader = None
-        if OCR_AVAILABLE:
-            try:
-                if OCR_TYPE == "easyocr":
-                    # Try GPU first, fallback to CPU if needed
-                    try:
-                        self.ocr_reader = easyocr.Reader(['en'], gpu=True)
-                        self.debug_log("EasyOCR initialized successfully (GPU mode)")
-                    except Exception as gpu_error:
-                        self.debug_log(f"GPU initialization failed: {gpu_error}, falling back to CPU")
-                        os.environ['CUDA_VISIBLE_DEVICES'] = ''
-                        self.ocr_reader = easyocr.Reader(['en'], gpu=False)
-                        self.debug_log("EasyOCR initialized successfully (CPU mode)")
-                elif OCR_TYPE == "pytesseract":
-                    # Test pytesseract availability
-                    pytesseract.image_to_string(Image.new('RGB', (10, 10)))
-                    self.debug_log("PyTesseract initialized successfully")
-            except Exception as e:
-                self.debug_log(f"OCR initialization failed: {e}")
-                # OCR_AVAILABLE = False
+        self._ocr_init_attempted = False
+        self._ocr_init_lock = threading.Lock()
+
+        # Rolling windows of saved debug screenshot paths, one per monitor
+        self._debug_files = {}
 
         # Create debug directory for screenshots if in debug mode
         if self.debug:
@@ -226,18 +403,23 @@ class ProductivityGuard:
         """Print debug information if debug mode is enabled."""
         if self.debug:
             timestamp = datetime.now().strftime("%H:%M:%S")
-            print(f"\n[DEBUG {timestamp}] {message}")
+            out = f"\n[DEBUG {timestamp}] {message}\n"
             if data:
                 if isinstance(data, str) and len(data) > 100:
-                    print(f"Data: {data[:100]}... (truncated)")
+                    out += f"Data: {data[:100]}... (truncated)\n"
+                elif orjson is not None:
+                    # orjson is ~5-10x faster on the large message structures
+                    # debug mode dumps per check
+                    out += f"Data: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}\n"
                 else:
-                    print(f"Data: {json.dumps(data, indent=2)}")
+                    out += f"Data: {json.dumps(data, indent=2)}\n"
+            # One buffered write per entry rather than a print per line
+            sys.stdout.write(out)
 
     def get_random_encouragement(self, category='procrastination'):
         """Get a random encouragement message from the specified category."""
-        import random
         messages = self.encouragement_messages.get(category, self.encouragement_messages['procrastination'])
-        return random.choice(messages)
+        return messages[self._rng.randrange(len(messages))]
 
     def start_pomodoro(self, minutes):
         """Start a pomodoro timer for the specified number of minutes."""
@@ -313,16 +495,17 @@ class ProductivityGuard:
             total_minutes = int(self.pomodoro_duration // 60)
             elapsed_minutes = int(elapsed_seconds // 60)
             
-            print(f"\n🍅 POMODORO TIMER ACTIVE")
-            print(f"⏰ Time remaining: {remaining_minutes:02d}:{remaining_secs:02d}")
-            print(f"📊 Progress: {elapsed_minutes}/{total_minutes} minutes")
-            
-            # Show simple progress bar
+            # Show simple progress bar, emitting the banner with one write
             progress = elapsed_seconds / self.pomodoro_duration
             bar_length = 20
             filled_length = int(bar_length * progress)
             bar = "█" * filled_length + "░" * (bar_length - filled_length)
-            print(f"🔥 [{bar}] {progress*100:.1f}%")
+            sys.stdout.write(
+                f"\n🍅 POMODORO TIMER ACTIVE\n"
+                f"⏰ Time remaining: {remaining_minutes:02d}:{remaining_secs:02d}\n"
+                f"📊 Progress: {elapsed_minutes}/{total_minutes} minutes\n"
+                f"🔥 [{bar}] {progress*100:.1f}%\n"
+            )
         else:
             # Timer has finished but hasn't been processed yet
             self.check_pomodoro_timer()
@@ -447,18 +630,19 @@ class ProductivityGuard:
             total_minutes = int(self.break_duration // 60)
             elapsed_minutes = int(elapsed_seconds // 60)
             
-            print(f"\n☕ BREAK MODE ACTIVE")
-            print(f"🎯 Activity: {self.break_activity}")
-            print(f"⏰ Time remaining: {remaining_minutes:02d}:{remaining_secs:02d}")
-            print(f"📊 Progress: {elapsed_minutes}/{total_minutes} minutes")
-            print(f"📸 Screenshot monitoring is PAUSED")
-            
-            # Show simple progress bar
+            # Show simple progress bar, emitting the banner with one write
             progress = elapsed_seconds / self.break_duration
             bar_length = 20
             filled_length = int(bar_length * progress)
             bar = "☕" * filled_length + "░" * (bar_length - filled_length)
-            print(f"🔋 [{bar}] {progress*100:.1f}%")
+            sys.stdout.write(
+                f"\n☕ BREAK MODE ACTIVE\n"
+                f"🎯 Activity: {self.break_activity}\n"
+                f"⏰ Time remaining: {remaining_minutes:02d}:{remaining_secs:02d}\n"
+                f"📊 Progress: {elapsed_minutes}/{total_minutes} minutes\n"
+                "📸 Screenshot monitoring is PAUSED\n"
+                f"🔋 [{bar}] {progress*100:.1f}%\n"
+            )
         else:
             # Break has finished but hasn't been processed yet
             self.check_break_timer()
@@ -472,55 +656,299 @@ class ProductivityGuard:
         monitor_dir = os.path.join(self.debug_dir, f"monitor_{monitor_index}")
         os.makedirs(monitor_dir, exist_ok=True)
 
-        # Get list of existing debug screenshots for this monitor
-        existing_files = sorted([f for f in os.listdir(monitor_dir) if f.endswith('.png')])
-
-        # Remove oldest files if we have more than 2 (to make room for new one)
-        while len(existing_files) >= 3:
-            oldest_file = os.path.join(monitor_dir, existing_files[0])
-            os.remove(oldest_file)
-            existing_files = existing_files[1:]
+        # Track the rolling window in a deque instead of re-listing and
+        # sorting the directory on every save
+        files = self._debug_files.get(monitor_index)
+        if files is None:
+            # First save this run: absorb leftovers from a previous session
+            existing = sorted(f for f in os.listdir(monitor_dir) if f.endswith('.png'))
+            for stale in existing[:-2]:
+                os.remove(os.path.join(monitor_dir, stale))
+            files = deque((os.path.join(monitor_dir, f) for f in existing[-2:]), maxlen=3)
+            self._debug_files[monitor_index] = files
+
+        # Make room for the new screenshot before the deque evicts the path
+        if len(files) == files.maxlen:
+            try:
+                os.remove(files[0])
+            except OSError:
+                pass
 
-        # Save new screenshot with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Save new screenshot with timestamp (microseconds avoid collisions
+        # at sub-second capture rates)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         debug_path = os.path.join(monitor_dir, f"screenshot_{timestamp}.png")
 
         # Save the image
         img.save(debug_path)
+        files.append(debug_path)
         self.debug_log(f"Saved debug screenshot for monitor {monitor_index}: {debug_path}")
 
+    @staticmethod
+    def _as_base64(screenshot):
+        """Return the base64 payload for a screenshot that may be raw bytes."""
+        if isinstance(screenshot, (bytes, bytearray, memoryview)):
+            return base64.b64encode(screenshot).decode('ascii')
+        return screenshot
+
     def process_image(self, img, max_width=800):
-        """Process image to reduce size while maintaining readability."""
+        """Process image to reduce size while maintaining readability.
+
+        Returns the encoded JPEG bytes and their content hash; base64
+        conversion happens later, only when a request payload is built.
+        """
         # Calculate new dimensions while maintaining aspect ratio
         ratio = max_width / img.width
         new_size = (max_width, int(img.height * ratio))
 
-        # Resize image
-        img = img.resize(new_size, Image.Resampling.LANCZOS)
-
-        # Save to bytes with compression
-        img_buffer = io.BytesIO()
-        img.save(img_buffer, format='PNG', optimize=True, quality=85)
-        processed_size = len(img_buffer.getvalue())
+        # Resize image. BOX is much cheaper than LANCZOS and plenty sharp
+        # for the downscaled copy the model sees
+        img = img.resize(new_size, Image.Resampling.BOX)
+
+        # JPEG is 5-10x smaller than optimized PNG for screenshots and far
+        # faster to encode; debug saves keep using PNG
+        # Reuse a per-thread buffer instead of allocating and discarding a
+        # fresh BytesIO every encode (monitors encode on pool threads)
+        img_buffer = getattr(self._jpeg_buffers, 'buf', None)
+        if img_buffer is None:
+            img_buffer = self._jpeg_buffers.buf = io.BytesIO()
+        img_buffer.seek(0)
+        img_buffer.truncate()
+        # Quality 80 with 4:2:0 chroma subsampling keeps UI text legible for
+        # the vision model while staying 5-10x smaller than PNG
+        img.save(img_buffer, format='JPEG', quality=80, subsampling=2, optimize=False)
+        # Return the raw JPEG bytes; base64 encoding is deferred until a
+        # payload is actually built, so cache hits never pay for it
+        raw_bytes = img_buffer.getvalue()
 
         if self.debug:
-            self.debug_log(f"Processed image size: {processed_size / 1024:.1f}KB")
+            self.debug_log(f"Processed image size: {len(raw_bytes) / 1024:.1f}KB")
             self.debug_log(f"New dimensions: {new_size[0]}x{new_size[1]}")
 
-        return base64.b64encode(img_buffer.getvalue()).decode()
+        # Hash the raw JPEG bytes here, where they are already in hand,
+        # rather than the 33%-larger base64 string on every model call
+        content_hash = _content_digest(raw_bytes)
+        return raw_bytes, content_hash
+
+    # Widest image handed to the OCR engine; larger captures are downscaled
+    OCR_MAX_WIDTH = 1280
+
+    # Blank rows inserted between monitors when batching them into one OCR call
+    OCR_BATCH_SEPARATOR = 20
+
+    def _extract_texts_batched(self, imgs):
+        """Run one EasyOCR pass over all monitors by stacking them vertically.
+
+        Amortizes the fixed per-call model overhead across monitors. Returns
+        a list of per-monitor texts, or None when batching doesn't apply
+        (mismatched widths after downscaling, or OCR failure) so the caller
+        can fall back to per-monitor extraction.
+        """
+        try:
+            arrays = []
+            for img in imgs:
+                if img.width > self.OCR_MAX_WIDTH:
+                    img = img.resize(
+                        (self.OCR_MAX_WIDTH, int(img.height * self.OCR_MAX_WIDTH / img.width)),
+                        Image.Resampling.BILINEAR)
+                arrays.append(np.asarray(img.convert('L')))
+
+            width = arrays[0].shape[1]
+            if any(a.shape[1] != width for a in arrays):
+                return None
+
+            separator = np.zeros((self.OCR_BATCH_SEPARATOR, width), dtype=np.uint8)
+            parts = []
+            spans = []  # (top, bottom) rows of each monitor in the stack
+            y = 0
+            for i, a in enumerate(arrays):
+                if i:
+                    parts.append(separator)
+                    y += self.OCR_BATCH_SEPARATOR
+                spans.append((y, y + a.shape[0]))
+                parts.append(a)
+                y += a.shape[0]
+            stacked = np.vstack(parts)
+
+            # Keep canvas_size at the stacked size so EasyOCR doesn't rescale
+            results = self.ocr_reader.readtext(
+                stacked, canvas_size=max(stacked.shape[0], stacked.shape[1]), mag_ratio=1.0)
+
+            # Partition detections back to their monitor by bbox y-centre
+            texts = [[] for _ in arrays]
+            for bbox, text, confidence in results:
+                if confidence <= 0.5:
+                    continue
+                mean_y = sum(point[1] for point in bbox) / len(bbox)
+                for i, (top, bottom) in enumerate(spans):
+                    if top <= mean_y < bottom + self.OCR_BATCH_SEPARATOR:
+                        texts[i].append(text)
+                        break
+            return [' '.join(t) for t in texts]
+        except Exception as e:
+            self.debug_log(f"Batched OCR failed, falling back to per-monitor: {e}")
+            return None
+
+    # Maximum entries kept in the OCR result cache
+    OCR_CACHE_SIZE = 64
+
+    # Frames whose grayscale standard deviation falls below this are treated
+    # as textless and skip the OCR engine entirely
+    OCR_MIN_STDDEV = 15.0
+
+    def _ensure_ocr_reader(self):
+        """Import and construct the OCR backend on first use.
+
+        Deferred from __init__ because importing easyocr pulls in torch and
+        loads ~100MB of model weights - seconds of startup and hundreds of
+        MB of RSS that a session pays up front even if the reader is never
+        needed. The warmup thread in run() triggers this during the initial
+        wait so the first real check doesn't stall.
+        """
+        if not OCR_AVAILABLE:
+            return
+        with self._ocr_init_lock:
+            if self.ocr_reader is not None or self._ocr_init_attempted:
+                return
+            self._ocr_init_attempted = True
+            global easyocr, pytesseract
+            try:
+                if OCR_TYPE == "easyocr":
+                    # Optional containment for easyocr's per-call native
+                    # memory leak: run the reader in a recycled subprocess
+                    if os.getenv('OCR_SUBPROCESS', 'false').lower() == 'true':
+                        self.ocr_reader = _SubprocessOCRReader()
+                        self.debug_log("EasyOCR running in a recycled worker subprocess")
+                        return
+                    import easyocr
+                    # Detect an accelerator up front (CUDA or Apple MPS)
+                    # rather than letting a blind gpu=True attempt fail;
+                    # quantize=True gives int8 inference on CPU-only boxes
+                    try:
+                        import torch
+                        use_gpu = torch.cuda.is_available() or torch.backends.mps.is_available()
+                    except Exception:
+                        use_gpu = False
+                    try:
+                        self.ocr_reader = easyocr.Reader(['en'], gpu=use_gpu, quantize=True, verbose=False)
+                        self.debug_log(f"EasyOCR initialized successfully ({'GPU' if use_gpu else 'quantized CPU'} mode)")
+                    except Exception as gpu_error:
+                        self.debug_log(f"GPU initialization failed: {gpu_error}, falling back to CPU")
+                        os.environ['CUDA_VISIBLE_DEVICES'] = ''
+                        self.ocr_reader = easyocr.Reader(['en'], gpu=False, quantize=True, verbose=False)
+                        self.debug_log("EasyOCR initialized successfully (CPU mode)")
+                    if not use_gpu:
+                        # quantize=True only covers the recognizer; dynamic
+                        # int8 on the CRAFT detector's linear/LSTM layers
+                        # roughly doubles its CPU throughput too
+                        try:
+                            self.ocr_reader.detector = torch.quantization.quantize_dynamic(
+                                self.ocr_reader.detector,
+                                {torch.nn.Linear, torch.nn.LSTM},
+                                dtype=torch.qint8)
+                            self.debug_log("EasyOCR detector dynamically quantized to int8")
+                        except Exception as quant_error:
+                            self.debug_log(f"Detector quantization skipped: {quant_error}")
+                elif OCR_TYPE == "pytesseract":
+                    import pytesseract
+                    # Test pytesseract availability
+                    pytesseract.image_to_string(Image.new('RGB', (10, 10)))
+                    self.debug_log("PyTesseract initialized successfully")
+            except Exception as e:
+                self.debug_log(f"OCR initialization failed: {e}")
 
     def extract_text_from_image(self, img):
         """Extract text from a PIL Image using OCR."""
-        if not OCR_AVAILABLE or not self.ocr_reader:
+        if not OCR_AVAILABLE:
+            return ""
+        self._ensure_ocr_reader()
+        if not self.ocr_reader:
             return ""
 
+        # Identical pixels produce identical text; serve repeats from the
+        # cache rather than re-running the OCR engine
+        cache_key = _content_digest(img.tobytes())
+        if cache_key in self._ocr_cache:
+            self._ocr_cache.move_to_end(cache_key)
+            self.debug_log("OCR cache hit")
+            return self._ocr_cache[cache_key]
+
+        text = self._run_ocr(img)
+        self._ocr_cache[cache_key] = text
+        if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        return text
+
+    # Edge map cell size (pixels) and gradient threshold for locating text
+    OCR_CROP_CELL = 8
+    OCR_CROP_EDGE_THRESHOLD = 24
+    # Skip the crop when the edge bounding box covers most of the frame
+    OCR_CROP_MAX_FRACTION = 0.7
+
+    def _crop_to_text_region(self, gray):
+        """Crop a grayscale frame to the area that plausibly contains text.
+
+        Text shows up as dense local gradients; smooth regions (wallpaper,
+        photo backgrounds) only slow the detector down. Works on a coarse
+        subsampled gradient map and returns the array unchanged when the
+        signal already spans most of the frame.
+        """
+        try:
+            cell = self.OCR_CROP_CELL
+            small = gray[::cell, ::cell].astype(np.int16)
+            edges = np.zeros(small.shape, dtype=bool)
+            edges[:, :-1] |= np.abs(np.diff(small, axis=1)) > self.OCR_CROP_EDGE_THRESHOLD
+            edges[:-1, :] |= np.abs(np.diff(small, axis=0)) > self.OCR_CROP_EDGE_THRESHOLD
+            rows = np.nonzero(edges.any(axis=1))[0]
+            cols = np.nonzero(edges.any(axis=0))[0]
+            if not len(rows) or not len(cols):
+                return gray
+            top = max(0, (rows[0] - 1) * cell)
+            bottom = min(gray.shape[0], (rows[-1] + 2) * cell)
+            left = max(0, (cols[0] - 1) * cell)
+            right = min(gray.shape[1], (cols[-1] + 2) * cell)
+            if (bottom - top) * (right - left) >= self.OCR_CROP_MAX_FRACTION * gray.size:
+                return gray
+            self.debug_log(f"OCR crop to text region: {right - left}x{bottom - top}")
+            return gray[top:bottom, left:right]
+        except Exception as e:
+            self.debug_log(f"Text-region crop failed: {e}")
+            return gray
+
+    def _run_ocr(self, img):
+        """Run the configured OCR engine over a PIL image."""
         try:
             if OCR_TYPE == "easyocr":
-                # Convert PIL Image to numpy array for EasyOCR
-                img_array = np.array(img)
-                results = self.ocr_reader.readtext(img_array)
-                # Extract text from results and join with spaces
-                text = ' '.join([result[1] for result in results if result[2] > 0.5])  # confidence > 0.5
+                # EasyOCR's detector cost scales with pixel count and screen
+                # text is still readable around 1280px wide, so downscale
+                # before running OCR rather than feeding native resolution
+                if img.width > self.OCR_MAX_WIDTH:
+                    img = img.resize(
+                        (self.OCR_MAX_WIDTH, int(img.height * self.OCR_MAX_WIDTH / img.width)),
+                        Image.Resampling.BILINEAR)
+                # Grayscale is all the detector needs and cuts the pixel
+                # data handed to torch by 3x
+                img_array = np.array(img.convert('L'))
+                # A near-uniform frame (blank desktop, full-screen video
+                # fade) can't contain readable text; skip the engine outright
+                if img_array.std() < self.OCR_MIN_STDDEV:
+                    self.debug_log("Frame too uniform to contain text, skipping OCR")
+                    return ""
+                # Restrict the detector to the edge-dense part of the frame
+                img_array = self._crop_to_text_region(img_array)
+                # canvas_size/mag_ratio stop EasyOCR from internally scaling
+                # the image back up
+                results = self.ocr_reader.readtext(img_array, canvas_size=self.OCR_MAX_WIDTH, mag_ratio=1.0)
+                if not results:
+                    return ""
+                # Filter by confidence with a vectorized mask and join the
+                # survivors top-to-bottom so the LLM sees text in reading
+                # order; dense screens can produce hundreds of detections
+                confidences = np.fromiter((r[2] for r in results), dtype=np.float32, count=len(results))
+                top_ys = np.fromiter((r[0][0][1] for r in results), dtype=np.float32, count=len(results))
+                keep = np.nonzero(confidences > 0.5)[0]
+                order = keep[np.argsort(top_ys[keep], kind='stable')]
+                text = ' '.join(results[i][1] for i in order)
                 return text
             elif OCR_TYPE == "pytesseract":
                 # PyTesseract works directly with PIL Images
@@ -532,48 +960,336 @@ class ProductivityGuard:
 
         return ""
 
+    # Frames whose average-hash differs by at most this many bits from the
+    # previous capture are treated as unchanged (cursor blinks, clock ticks)
+    FRAME_HASH_THRESHOLD = 5
+
+    # Below this hash distance the screen is "the same apart from jitter":
+    # the previous OCR text is reused while the model still gets fresh images
+    FRAME_OCR_REUSE_THRESHOLD = 8
+
+    # With multiple monitors and mouse tracking, capture all monitors only
+    # every Nth tick; the others capture just the active monitor
+    FULL_SWEEP_EVERY = 5
+
+    # After this many consecutive skipped cycles, force a full reprocess so
+    # a stale verdict can't stick forever on a near-static screen
+    FORCE_FULL_RECHECK = 10
+
+    # Maximum entries kept in the model-verdict LRU cache
+    LLM_CACHE_SIZE = 64
+
+    # Maximum prepared data: URLs kept around (each is a full payload copy)
+    DATA_URL_CACHE_SIZE = 8
+
+    # Screens with less extracted text than this skip the model call unless
+    # a known distraction site shows up in what little there is
+    MIN_OCR_CHARS_FOR_LLM = 20
+
+    def _perceptual_hash(self, img):
+        """Compute an 8x8 average-hash of a PIL image as a plain int."""
+        pixels = np.asarray(img.resize((8, 8), Image.Resampling.BILINEAR).convert('L'), dtype=np.float32)
+        bits = np.packbits(pixels > pixels.mean())
+        return int.from_bytes(bits.tobytes(), 'big')
+
+    def _process_monitor(self, img, index, extracted_text=None):
+        """Run OCR and LLM encoding for a single captured monitor image.
+
+        extracted_text may be supplied when OCR already ran in batched mode.
+        """
+        if self.debug:
+            self.debug_log(f"Original dimensions for monitor {index}: {img.width}x{img.height}")
+            self.debug_log(f"Original size for monitor {index}: {img.width * img.height * 3 / 1024:.1f}KB")
+            self.save_debug_screenshot(img, index)
+
+        # Extract text from the image before processing. When OCR runs here,
+        # downsample once up front and share the small image with the LLM
+        # encode below, instead of resizing the full-resolution frame twice.
+        if extracted_text is None:
+            if img.width > self.OCR_MAX_WIDTH:
+                img = img.resize(
+                    (self.OCR_MAX_WIDTH, int(img.height * self.OCR_MAX_WIDTH / img.width)),
+                    Image.Resampling.BILINEAR)
+            extracted_text = self.extract_text_from_image(img)
+
+        if self.debug and extracted_text:
+            self.debug_log(f"Extracted text from monitor {index} (first 200 chars): {extracted_text[:200]}")
+
+        # Process and encode the image
+        encoded_image, content_hash = self.process_image(img)
+        return extracted_text, encoded_image, content_hash
+
+    def _shutdown_executors(self):
+        """Stop the worker pools without waiting on in-flight model calls.
+
+        Cancels anything still queued (e.g. a speculative Pro request that
+        never started) so Ctrl-C or 'end' doesn't sit behind a network call
+        that no longer matters.
+        """
+        self.llm_executor.shutdown(wait=False, cancel_futures=True)
+        self.monitor_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _effective_interval(self):
+        """Current wait between checks, stretched by a productive streak.
+
+        Each consecutive clean check adds 25% to the base interval, capped
+        at 4x; anything unproductive (or uncategorizable) snaps it back so
+        responsiveness returns the moment behavior changes.
+        """
+        return min(self.interval * (1 + 0.25 * self._clean_streak), self.interval * 4)
+
+    # Padding in points kept around the active window when cropping
+    WINDOW_CROP_MARGIN = 16
+
+    def _get_active_window_bounds(self):
+        """Bounds of the frontmost on-screen window (macOS only), or None."""
+        if sys.platform != 'darwin':
+            return None
+        try:
+            import Quartz
+            options = (Quartz.kCGWindowListOptionOnScreenOnly
+                       | Quartz.kCGWindowListExcludeDesktopElements)
+            for window in Quartz.CGWindowListCopyWindowInfo(options, Quartz.kCGNullWindowID):
+                # Layer 0 is the normal window level; the list is front-to-back
+                if window.get('kCGWindowLayer', 1) != 0:
+                    continue
+                bounds = window.get('kCGWindowBounds')
+                if bounds:
+                    return (int(bounds['X']), int(bounds['Y']),
+                            int(bounds['Width']), int(bounds['Height']))
+        except Exception as e:
+            self.debug_log(f"Active window lookup failed: {e}")
+        return None
+
+    def _crop_to_active_window(self, img, monitor, bounds):
+        """Crop a capture to the frontmost window when it sits on this monitor.
+
+        Most of a large display is chrome and wallpaper that only slows OCR
+        down; cropping to the active window cuts the pixel budget and keeps
+        the analysis focused on what the user is actually using. Returns the
+        image untouched when the window is elsewhere or already fills the
+        frame.
+        """
+        try:
+            x, y, w, h = bounds
+            mon_w = monitor.get('width', img.width)
+            mon_left, mon_top = monitor.get('left', 0), monitor.get('top', 0)
+            scale = img.width / mon_w if mon_w else 1  # Retina points -> pixels
+            margin = self.WINDOW_CROP_MARGIN
+            left = max(0, int((x - mon_left - margin) * scale))
+            top = max(0, int((y - mon_top - margin) * scale))
+            right = min(img.width, int((x - mon_left + w + margin) * scale))
+            bottom = min(img.height, int((y - mon_top + h + margin) * scale))
+            if right <= left or bottom <= top:
+                return img  # window lives on another monitor
+            if (right - left) * (bottom - top) >= 0.9 * img.width * img.height:
+                return img  # effectively full screen already
+            return img.crop((left, top, right, bottom))
+        except Exception as e:
+            self.debug_log(f"Active window crop failed: {e}")
+            return img
+
+    def _update_active_monitor(self, x, y):
+        """Record which monitor currently contains the mouse pointer."""
+        try:
+            for idx, monitor in enumerate(self.sct.monitors[1:]):
+                if (monitor['left'] <= x < monitor['left'] + monitor['width']
+                        and monitor['top'] <= y < monitor['top'] + monitor['height']):
+                    self._active_monitor_idx = idx
+                    return
+        except Exception:
+            pass
+
+    def _start_mouse_listener(self):
+        """Start the optional pynput mouse listener for active-monitor tracking.
+
+        When available, most capture ticks only grab the monitor the mouse
+        is on; without pynput every tick sweeps all monitors as before.
+        """
+        if not _module_available('pynput'):
+            return
+        try:
+            from pynput import mouse
+            listener = mouse.Listener(on_move=self._update_active_monitor)
+            listener.daemon = True
+            listener.start()
+            self.debug_log("Mouse listener started for active-monitor capture")
+        except Exception as e:
+            self.debug_log(f"Mouse listener unavailable: {e}")
+
+    def _grab_all_monitors(self, selected):
+        """Grab the all-in-one virtual screen once and slice it per monitor.
+
+        Returns {monitor_index: RGB ndarray view} or None when the combined
+        geometry doesn't line up (mixed DPI scaling, holes in the layout),
+        in which case the caller falls back to per-monitor grabs.
+        """
+        try:
+            bounding = self.sct.monitors[0]
+            full = self.sct.grab(bounding)
+            full_arr = np.frombuffer(full.raw, dtype=np.uint8)
+            full_arr = full_arr.reshape(full.height, full.width, 4)
+            slices = {}
+            for i, monitor in selected:
+                top = monitor['top'] - bounding.get('top', 0)
+                left = monitor['left'] - bounding.get('left', 0)
+                sub = full_arr[top:top + monitor['height'],
+                               left:left + monitor['width'], 2::-1]
+                if sub.shape[:2] != (monitor['height'], monitor['width']):
+                    return None
+                slices[i] = sub
+            return slices
+        except Exception as e:
+            self.debug_log(f"Combined grab failed, falling back to per-monitor: {e}")
+            return None
+
     def take_screenshot(self):
-        """Take a screenshot of all monitors using MSS and return them as base64 encoded strings with extracted text."""
+        """Take a screenshot of all monitors using MSS and return them as encoded images with extracted text."""
+
 
-        
         print("\n📸 Taking screenshot...")
-        
+
         self.debug_log("Taking screenshot...")
         try:
             # Get all monitors
             monitors = self.sct.monitors[1:]  # Skip the "all in one" monitor
-            screenshots = []
-            extracted_texts = []
 
-            # Capture and process each monitor
-            for i, monitor in enumerate(monitors, 1):
+            # Most ticks capture only the monitor the mouse is on (when a
+            # listener is available); a full sweep of every monitor still
+            # runs every FULL_SWEEP_EVERY ticks to catch the others
+            selected = list(enumerate(monitors, 1))
+            if (len(monitors) > 1 and self._active_monitor_idx is not None
+                    and self._capture_tick % self.FULL_SWEEP_EVERY != 0):
+                active = min(self._active_monitor_idx, len(monitors) - 1)
+                selected = [(active + 1, monitors[active])]
+                self.debug_log(f"Capturing active monitor {active + 1} only")
+            self._capture_tick += 1
+
+            # Crop each capture to the frontmost window where the platform
+            # can tell us (applied before hashing, so change detection
+            # tracks the window content too)
+            active_bounds = self._get_active_window_bounds()
+
+            # When sweeping several monitors, one grab of the all-in-one
+            # bounding rect replaces a compositor round-trip per monitor;
+            # each monitor's pixels are then just a view into that buffer
+            sweep_slices = None
+            if len(selected) > 1:
+                sweep_slices = self._grab_all_monitors(selected)
+
+            # Grab the selected monitors on the main thread (MSS is not
+            # thread-safe) and hash each frame for change detection
+            captures = []  # (index, img, hamming distance to previous frame)
+            for i, monitor in selected:
                 self.debug_log(f"Capturing monitor {i}...")
-                screenshot = self.sct.grab(monitor)
-                img = Image.frombytes('RGB', screenshot.size, screenshot.rgb)
-
-                if self.debug:
-                    self.debug_log(f"Original dimensions for monitor {i}: {img.width}x{img.height}")
-                    self.debug_log(f"Original size for monitor {i}: {len(screenshot.rgb) / 1024:.1f}KB")
-                    self.save_debug_screenshot(img, i)
+                if sweep_slices is not None:
+                    arr = sweep_slices[i]
+                else:
+                    screenshot = self.sct.grab(monitor)
+                    # View the raw BGRA buffer through numpy and reorder
+                    # channels to RGB instead of paying for the
+                    # Image.frombytes copy of the .rgb conversion. .raw is
+                    # the capture's own bytearray; the .bgra/.rgb properties
+                    # would each build a fresh copy.
+                    arr = np.frombuffer(screenshot.raw, dtype=np.uint8)
+                    arr = arr.reshape(screenshot.height, screenshot.width, 4)[:, :, 2::-1]
+                img = Image.fromarray(arr)
+                if active_bounds is not None:
+                    img = self._crop_to_active_window(img, monitor, active_bounds)
+                distance = None
+                try:
+                    frame_hash = self._perceptual_hash(img)
+                    previous = self.previous_frame_hashes.get(i)
+                    if previous is not None:
+                        distance = bin(frame_hash ^ previous).count('1')
+                    self.previous_frame_hashes[i] = frame_hash
+                except Exception as e:
+                    self.debug_log(f"Perceptual hash failed for monitor {i}: {e}")
+                captures.append((i, img, distance))
+
+            # Decide per monitor how much work this cycle needs: unchanged
+            # frames reuse the previous results outright, jittery frames
+            # (cursor, clock) reuse the OCR text but re-encode for the
+            # model, anything else is fully reprocessed
+            # Periodically revalidate even an apparently unchanged screen
+            force_full = self._skip_streak >= self.FORCE_FULL_RECHECK
+
+            results = {}
+            pending = []  # (index, img, known_text)
+            for i, img, distance in captures:
+                cached = self._monitor_results.get(i)
+                if not force_full and cached is not None and distance is not None:
+                    if distance <= self.FRAME_HASH_THRESHOLD:
+                        results[i] = cached
+                        continue
+                    if distance <= self.FRAME_OCR_REUSE_THRESHOLD:
+                        self.debug_log(f"Minor change on monitor {i}, reusing previous OCR text")
+                        pending.append((i, img, cached[0]))
+                        continue
+                pending.append((i, img, None))
+
+            self.last_frame_unchanged = bool(captures) and not pending
+            if self.last_frame_unchanged:
+                self._skip_streak += 1
+                self.debug_log("Frames unchanged since last capture, reusing previous results")
+            else:
+                self._skip_streak = 0
+                # One stacked EasyOCR call covers every monitor still
+                # needing text, leaving the pool to parallelize encoding
+                need_ocr = [p for p in pending if p[2] is None]
+                if len(need_ocr) > 1 and OCR_TYPE == "easyocr":
+                    self._ensure_ocr_reader()
+                    if self.ocr_reader:
+                        batched = self._extract_texts_batched([img for _, img, _ in need_ocr])
+                        if batched is not None:
+                            known = dict(zip((i for i, _, _ in need_ocr), batched))
+                            pending = [(i, img, known.get(i, text)) for i, img, text in pending]
+
+                # OCR and image encoding dominate each cycle and both
+                # release the GIL (torch forward pass, PIL's C encoders), so
+                # process the monitors concurrently when there are several
+                if len(pending) > 1:
+                    processed = list(self.monitor_executor.map(
+                        self._process_monitor,
+                        [img for _, img, _ in pending],
+                        [i for i, _, _ in pending],
+                        [text for _, _, text in pending]))
+                else:
+                    processed = [self._process_monitor(img, i, text)
+                                 for i, img, text in pending]
+                for (i, _, _), result in zip(pending, processed):
+                    results[i] = result
+                    self._monitor_results[i] = result
 
-                # Extract text from the image before processing
-                extracted_text = self.extract_text_from_image(img)
+            screenshots = []
+            extracted_texts = []
+            self.screenshot_hashes = []
+            for i, _, _ in captures:
+                extracted_text, encoded_image, content_hash = results[i]
                 extracted_texts.append(extracted_text)
-
-                if self.debug and extracted_text:
-                    self.debug_log(f"Extracted text from monitor {i} (first 200 chars): {extracted_text[:200]}")
-
-                # Process and encode the image
-                encoded_image = self.process_image(img)
                 screenshots.append(encoded_image)
+                self.screenshot_hashes.append(content_hash)
+            self._hash_source = list(screenshots)
 
             self.debug_log("Screenshots captured successfully")
-    
+
             return screenshots, extracted_texts
         except Exception as e:
             print(f"Error taking screenshot: {e}")
             return None, None
 
+    def _rebuild_prompt_prefix(self):
+        """Cache the detection prompt prefix (system prompt plus exceptions).
+
+        Rebuilt only when the exception list changes rather than joined on
+        every model call.
+        """
+        if self.productivity_exceptions:
+            exceptions_text = "\n\nThe following things are productive. Previously, you've accidentally mistaken these for unproductive things, so if what the user is doing is plausibly this, please don't interrupt:\n" + "\n".join(self.productivity_exceptions)
+            self._prompt_prefix = SYSTEM_PROMPT + exceptions_text
+        else:
+            self._prompt_prefix = SYSTEM_PROMPT
+
     def _check_with_model(self, screenshots, extracted_texts, model_name, use_reasoning=False, print_reasoning=False):
         """Send screenshots to specified model and check if user is procrastinating."""
         if not screenshots:
@@ -581,27 +1297,39 @@ class ProductivityGuard:
             return False, ""
 
         try:
-            # Check if screenshots are identical to previous ones for this model
-            current_hashes = []
-            for screenshot in screenshots:
-                current_hash = hashlib.md5(screenshot.encode()).hexdigest()
-                current_hashes.append(current_hash)
-
-            cache_key = (tuple(current_hashes), model_name)
-            if cache_key in self.previous_screenshots:
-                self.debug_log(f"Screenshots identical to previous check with {model_name}, reusing last result")
-                result, cached_response = self.previous_screenshots[cache_key]
-                print(f"Decision (from cache, {model_name}): {'Procrastinating' if result else 'Working'}")
-                return result, cached_response
+            # Check if screenshots are identical to previous ones for this
+            # model. Captures carry hashes computed at encode time; anything
+            # else (e.g. screenshots passed in directly) is hashed here.
+            if (self.screenshot_hashes
+                    and len(self.screenshot_hashes) == len(screenshots)
+                    and all(s is h for s, h in zip(screenshots, self._hash_source))):
+                current_hashes = list(self.screenshot_hashes)
+            else:
+                current_hashes = [
+                    _content_digest(
+                        screenshot if isinstance(screenshot, (bytes, bytearray, memoryview))
+                        else screenshot.encode())
+                    for screenshot in screenshots
+                ]
+
+            # Key on the concatenated 16-byte digests rather than a tuple of
+            # hex strings - a single small bytes hash per lookup
+            cache_key = b''.join(current_hashes) + model_name.encode()
+            # The Flash and Pro calls run on pool threads; serialize their
+            # access to the shared caches
+            with self._llm_cache_lock:
+                if cache_key in self.previous_screenshots:
+                    self.debug_log(f"Screenshots identical to previous check with {model_name}, reusing last result")
+                    self.previous_screenshots.move_to_end(cache_key)
+                    result, cached_response = self.previous_screenshots[cache_key]
+                    print(f"Decision (from cache, {model_name}): {'Procrastinating' if result else 'Working'}")
+                    return result, cached_response
 
             self.debug_log(f"Sending screenshots to {model_name} for analysis...")
 
-            # Add exceptions if any exist
-            if self.productivity_exceptions:
-                exceptions_text = "\n\nThe following things are productive. Previously, you've accidentally mistaken these for unproductive things, so if what the user is doing is plausibly this, please don't interrupt:\n" + "\n".join(self.productivity_exceptions)
-                prompt_text = SYSTEM_PROMPT + exceptions_text
-            else:
-                prompt_text = SYSTEM_PROMPT
+            # Start from the cached prefix (system prompt + exceptions); it
+            # only changes when the user adds an exception
+            prompt_text = self._prompt_prefix
 
             # Add extracted text if available
             if OCR_AVAILABLE and extracted_texts:
@@ -613,72 +1341,54 @@ class ProductivityGuard:
                 if text_content:
                     prompt_text += "\n\nExtracted text from screens:\n" + "\n\n".join(text_content)
 
-            prompt_text += "\n\nFirst, describe what you see in 1-2 sentences.\nThen on a new line, end your response with ONLY with the word 'yes' or 'no' (no punctuation) and nothing else."
+            prompt_text += ANSWER_INSTRUCTION
 
-            # Create message content with all screenshots
-            content: List[Dict[str, Any]] = [{
-                "type": "text", 
+            # Build the OpenAI message format directly; the screenshots are
+            # ~1MB of base64 each, so a single-pass build avoids holding a
+            # second intermediate copy of every payload
+            openai_content: List[Dict[str, Any]] = [{
+                "type": "text",
                 "text": prompt_text
             }]
-
-            # Add each screenshot as a separate image
-            for i, screenshot in enumerate(screenshots, 1):
-                content.append({
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": "image/png",
-                        "data": screenshot
+            for screenshot, content_hash in zip(screenshots, current_hashes):
+                with self._llm_cache_lock:
+                    url = self._data_url_cache.get(content_hash)
+                    if url is None:
+                        url = f"data:image/jpeg;base64,{self._as_base64(screenshot)}"
+                        self._data_url_cache[content_hash] = url
+                        if len(self._data_url_cache) > self.DATA_URL_CACHE_SIZE:
+                            self._data_url_cache.popitem(last=False)
+                    else:
+                        self._data_url_cache.move_to_end(content_hash)
+                openai_content.append({
+                    "type": "image_url",
+                    "image_url": {
+                        "url": url
                     }
                 })
 
-            messages = [{
-                "role": "user",
-                "content": content
-            }]
+            openai_messages = [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": openai_content
+                }
+            ]
 
             if self.debug:
                 # Create a debug version of the message without the actual image data
                 debug_content = [{"type": "text", "text": "Analyze these screenshots and determine if the person is procrastinating..."}]
                 for i in range(len(screenshots)):
                     debug_content.append({
-                        "type": "image",
-                        "source": "[IMAGE DATA]"
+                        "type": "image_url",
+                        "image_url": "[IMAGE DATA]"
                     })
                 debug_messages = [{"role": "user", "content": debug_content}]
                 self.debug_log("Sending message to Gemini:", debug_messages)
 
-            # Convert message format for OpenAI API
-            openai_messages = []
-            
-            # Add system message
-            openai_messages.append({
-                "role": "system",
-                "content": SYSTEM_PROMPT
-            })
-            
-            # Convert content format for OpenAI
-            openai_content = []
-            for item in content:
-                if item["type"] == "text":
-                    openai_content.append({
-                        "type": "text",
-                        "text": item["text"]
-                    })
-                elif item["type"] == "image":
-                    # OpenAI expects image_url format
-                    openai_content.append({
-                        "type": "image_url",
-                        "image_url": {
-                            "url": f"data:{item['source']['media_type']};base64,{item['source']['data']}"
-                        }
-                    })
-            
-            openai_messages.append({
-                "role": "user",
-                "content": openai_content
-            })
-            
             # Show loading feedback
             if not self.in_intervention:  # Only show if not in intervention mode
                 print("🔍 Analyzing screenshots... ", end='', flush=True)
@@ -688,32 +1398,53 @@ class ProductivityGuard:
             if use_reasoning and ("pro" in model_name.lower() or "reasoning" in model_name.lower() or "thinking" in model_name.lower()):
                 extra_body["reasoning"] = {}
             
+            # Stream the response so the waiting indicator shows life from
+            # the first token instead of a silent stall for the whole
+            # generation; the verdict is the last line, so the stream is
+            # consumed in full either way
             completion = self.client.chat.completions.create(
                 model=model_name,
                 messages=openai_messages,
-                extra_body=extra_body
+                extra_body=extra_body,
+                stream=True
             )
-            
-            # Clear loading message
-            if not self.in_intervention:
-                print("\r" + " " * 30 + "\r", end='', flush=True)
-            
 
+            try:
+                chunk_iter = iter(completion)
+            except TypeError:
+                # Client/transport returned a plain completion object
+                response = completion.choices[0].message.content.strip()
+            else:
+                show_progress = not self.in_intervention and not self.pomodoro_active
+                pieces = []
+                for chunk in chunk_iter:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        pieces.append(delta)
+                        if show_progress and len(pieces) % 8 == 0:
+                            print(".", end='', flush=True)
+                response = ''.join(pieces).strip()
 
-            response = completion.choices[0].message.content.strip()
+            # Clear loading message
+            if not self.in_intervention:
+                print("\r" + " " * 50 + "\r", end='', flush=True)
             self.debug_log(f"Full response from {model_name}: {response}")
 
             # Print reasoning if requested (for Flash model)
             if print_reasoning:
                 print(f"\nFlash reasoning about potential procrastination: {response}")
 
-            # Store the description (everything except the last line)
-            self.last_description = '\n'.join(response.split('\n')[:-1])
+            # The description (everything except the last line) is recorded
+            # by check_procrastination from whichever response actually
+            # decides the verdict, so a cancelled speculative call can't
+            # overwrite it mid-intervention
+            last_line = response.rpartition('\n')[2]
 
-            # Extract the yes/no answer by looking at the last line and removing punctuation
-            last_line = response.split('\n')[-1].strip().lower()
-            last_line = ''.join(c for c in last_line if c.isalpha())  # Remove all non-letter characters
-            is_procrastinating = last_line == 'yes'
+            # Extract the yes/no answer from the last line; the precompiled
+            # regex tolerates surrounding punctuation like "**Yes.**"
+            match = _YESNO_RE.match(last_line)
+            answer = match.group(1).lower() if match else ''
+            is_procrastinating = answer == 'yes'
 
             # Print the decision with better formatting, considering pomodoro state
             status_icon = "⚠️" if is_procrastinating else "✅"
@@ -725,11 +1456,15 @@ class ProductivityGuard:
             else:
                 print(f"\n{status_icon} Decision ({model_name}): {status_text}")
 
-            # Cache the result with full response
-            self.previous_screenshots[cache_key] = (is_procrastinating, response)
+            # Cache the result with full response, evicting the least
+            # recently used entry once the cache is full
+            with self._llm_cache_lock:
+                self.previous_screenshots[cache_key] = (is_procrastinating, response)
+                if len(self.previous_screenshots) > self.LLM_CACHE_SIZE:
+                    self.previous_screenshots.popitem(last=False)
 
             if self.debug:
-                self.debug_log(f"Extracted answer: {last_line}")
+                self.debug_log(f"Extracted answer: {answer}")
                 self.debug_log(f"Procrastination detected: {is_procrastinating}")
 
             return is_procrastinating, response
@@ -737,45 +1472,105 @@ class ProductivityGuard:
             print(f"Error checking procrastination with {model_name}: {e}")
             return False, ""
 
+    def _too_little_text_for_llm(self, extracted_texts):
+        """True when OCR ran and found too little text to justify a model call.
+
+        A bare desktop, wallpaper or lock screen yields almost no text; as
+        long as none of the obvious distraction sites appear in what little
+        there is, the model round-trip is pure waste. Never gates when OCR
+        isn't running, since visual analysis is then the only signal.
+        """
+        if not (OCR_AVAILABLE and self.ocr_reader and extracted_texts is not None):
+            return False
+        joined_text = ' '.join(extracted_texts)
+        return (len(joined_text.strip()) < self.MIN_OCR_CHARS_FOR_LLM
+                and not _PROCRASTINATION_KEYWORDS_RE.search(joined_text))
+
     def check_procrastination(self, screenshots, extracted_texts=None):
         """Two-step procrastination check: Flash first, then Pro with reasoning if needed."""
         if not screenshots:
             self.debug_log("No screenshots available to check")
             return False
 
+        # Cheap local gate: skip the model round-trip on near-textless screens
+        if self._too_little_text_for_llm(extracted_texts):
+            self.debug_log("Too little on-screen text to analyze, skipping model call")
+            return False
+
         # Check if budget mode is enabled
         budget_mode = os.getenv('BUDGET_MODE', 'false').lower() == 'true'
-        
+
         # Step 1: Quick check with Flash (always print reasoning)
         flash_model = os.getenv('MEDIUM_MODEL', 'google/gemini-2.5-flash')
         self.debug_log("Step 1: Checking with Flash model...")
-        
-        flash_result, flash_response = self._check_with_model(
-            screenshots, extracted_texts, flash_model, 
-            use_reasoning=False, print_reasoning=True
-        )
-        
-        if not flash_result:
-            # Flash says not procrastinating, we're done
-            self.debug_log("Flash says not procrastinating, skipping Pro check")
-            return False
-        
-        # If budget mode is enabled, skip Pro model and use Flash result
+
+        # In budget mode only Flash ever runs, so stay sequential
         if budget_mode:
+            flash_result, flash_response = self._check_with_model(
+                screenshots, extracted_texts, flash_model,
+                use_reasoning=False, print_reasoning=True
+            )
+            self._last_check_used_pro = False
+            self.last_description = flash_response.rpartition('\n')[0]
+            if not flash_result:
+                self.debug_log("Flash says not procrastinating, skipping Pro check")
+                return False
             self.debug_log("Budget mode enabled - using Flash result only")
             if not self.pomodoro_active:
                 print(f"\n💡 Flash (Budget mode) response: {flash_response}")
             return flash_result
-        
-        # Step 2: Flash detected procrastination, verify with Pro + reasoning
+
+        # Fire Pro speculatively only when the previous check escalated to
+        # Pro: during sustained procrastination its latency hides behind
+        # Flash's, while the common clean check pays for Flash alone. A
+        # speculative future that turns out unneeded is cancelled
+        # best-effort and its result ignored.
         pro_model = os.getenv('BEST_MODEL', 'google/gemini-2.5-pro')
+        flash_future = self.llm_executor.submit(
+            self._check_with_model, screenshots, extracted_texts, flash_model,
+            False, True)
+        pro_future = None
+        if self._last_check_used_pro:
+            pro_future = self.llm_executor.submit(
+                self._check_with_model, screenshots, extracted_texts, pro_model,
+                True, False)
+
+        flash_result, flash_response = flash_future.result()
+
+        if not flash_result:
+            # Flash says not procrastinating, we're done
+            if pro_future is not None:
+                pro_future.cancel()
+            self._last_check_used_pro = False
+            self.last_description = flash_response.rpartition('\n')[0]
+            self.debug_log("Flash says not procrastinating, skipping Pro check")
+            return False
+
+        # Flash flagged procrastination; trust a high-confidence verdict
+        # outright and only wait on Pro when Flash itself is unsure (a
+        # missing confidence marker counts as unsure)
+        match = _YESNO_RE.match(flash_response.rpartition('\n')[2])
+        flash_confidence = (match.group(2) or 'low').lower() if match else 'low'
+        if flash_confidence == 'high':
+            if pro_future is not None:
+                pro_future.cancel()
+            self._last_check_used_pro = False
+            self.last_description = flash_response.rpartition('\n')[0]
+            self.debug_log("Flash is highly confident, skipping Pro verification")
+            return True
+
+        # Step 2: Flash detected procrastination, verify with Pro +
+        # reasoning - using the in-flight speculative call when there is one
         self.debug_log("Step 2: Flash detected procrastination, verifying with Pro + reasoning...")
-        
-        pro_result, pro_response = self._check_with_model(
-            screenshots, extracted_texts, pro_model, 
-            use_reasoning=True, print_reasoning=False
-        )
-        
+        if pro_future is None:
+            pro_future = self.llm_executor.submit(
+                self._check_with_model, screenshots, extracted_texts, pro_model,
+                True, False)
+        self._last_check_used_pro = True
+
+        pro_result, pro_response = pro_future.result()
+        self.last_description = pro_response.rpartition('\n')[0]
+
         # Always print Pro's response, but consider pomodoro state
         if not self.pomodoro_active:
             print(f"\n🤖 Pro (Gemini 2.5) response: {pro_response}")
@@ -856,7 +1651,7 @@ class ProductivityGuard:
                 content.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{screenshot}"
+                        "url": f"data:image/jpeg;base64,{self._as_base64(screenshot)}"
                     }
                 })
 
@@ -935,6 +1730,42 @@ class ProductivityGuard:
 
         self.debug_log(f"Logged activity: {category} - {description}")
 
+    def log_activities_bulk(self, entries):
+        """Log several activities at once, writing the daily log in one I/O.
+
+        Each entry is a (category, description, timestamp) tuple. Durations
+        are derived from consecutive timestamps, and all rows are appended to
+        the daily log file with a single write instead of one open/write per
+        activity.
+        """
+        if not self.workday_active or not entries:
+            return
+
+        rows = []
+        for category, description, timestamp in entries:
+            # Close out whatever activity was running before this entry
+            if self.current_activity and self.current_activity_start:
+                duration = (timestamp - self.current_activity_start).total_seconds()
+                if self.current_activity in self.activity_categories:
+                    self.activity_categories[self.current_activity] += duration
+
+            self.activity_log.append({
+                'timestamp': timestamp,
+                'category': category,
+                'description': description,
+                'duration_start': timestamp
+            })
+            self.current_activity = category
+            self.current_activity_start = timestamp
+
+            row = f"- **{timestamp.strftime('%H:%M')}** - {category.title()}"
+            if description:
+                row += f": {description}"
+            rows.append(row + "\n")
+
+        self.append_to_daily_log("".join(rows))
+        self.debug_log(f"Logged {len(entries)} activities in bulk")
+
     def check_hourly_summary(self):
         """Check if it's time for an hourly summary and generate one if needed."""
         current_time = datetime.now()
@@ -1136,7 +1967,10 @@ Recent Activity Log:
         
         # Save final summary to file
         self.save_workday_summary_to_file()
-        
+
+        # Don't let speculative model calls keep the process alive
+        self._shutdown_executors()
+
         print("\nProductivityGuard stopped. Have a great rest of your day! 🌟")
 
     def setup_daily_logging(self):
@@ -2100,7 +2934,21 @@ Only suggest obvious completions or important additions. Be conservative.
         try:
             # Print the prompt and wait for input
             print(prompt, end='', flush=True)
-            
+
+            # On POSIX, read stdin directly; there is no input thread
+            if self._use_select_input:
+                while not self.stop_monitoring:
+                    try:
+                        ready, _, _ = select.select([sys.stdin], [], [], 0.5)
+                    except (OSError, ValueError):
+                        return "exit"
+                    if ready:
+                        line = sys.stdin.readline()
+                        if not line:
+                            return "exit"
+                        return line.strip()
+                return "exit"
+
             # Wait for input from the queue (the input thread will handle it)
             while True:
                 try:
@@ -2111,7 +2959,7 @@ Only suggest obvious completions or important additions. Be conservative.
                     if self.stop_monitoring:
                         return "exit"
                     continue
-                    
+
         except (EOFError, KeyboardInterrupt):
             # Handle Ctrl+C or Ctrl+D gracefully
             return "exit"
@@ -2119,62 +2967,105 @@ Only suggest obvious completions or important additions. Be conservative.
             self.debug_log(f"Error getting user input: {e}")
             return "exit"
 
+    def _translate_command(self, user_input):
+        """Map a raw monitoring-mode input line to its canonical command token."""
+        lower = user_input.lower()
+        if lower in ["end", "end workday", "finish", "stop workday"]:
+            return "end_workday"
+        if lower in ["summary", "status", "progress"]:
+            return "get_summary"
+        if lower in ["todos", "todo", "list"]:
+            return "show_todos"
+        if lower in ["pomodoro", "timer", "timer status"]:
+            return "pomodoro_status"
+        if lower in ["break", "break status"]:
+            return "break_status"
+        # Prefixed commands (x/done/add/pomodoro/break) and anything else
+        # pass through unchanged
+        return user_input
+
     def input_thread(self):
-        """Separate thread to handle user input without blocking."""
+        """Separate thread to handle user input without blocking.
+
+        Only used on platforms where select() can't poll stdin directly.
+        """
         while not self.stop_monitoring:
             try:
                 user_input = input()
-                
-                # During intervention, always put input in queue
-                # During normal monitoring, handle 'x' commands directly
+
+                # During intervention, always put raw input in queue
                 if self.in_intervention:
                     self.input_queue.put(user_input)
                 else:
-                    # Handle commands during normal monitoring
-                    if user_input.lower().startswith("x "):
-                        self.input_queue.put(user_input)
-                    elif user_input.lower() in ["end", "end workday", "finish", "stop workday"]:
-                        self.input_queue.put("end_workday")
-                    elif user_input.lower() in ["summary", "status", "progress"]:
-                        self.input_queue.put("get_summary")
-                    elif user_input.lower() in ["todos", "todo", "list"]:
-                        self.input_queue.put("show_todos")
-                    elif user_input.lower().startswith("done "):
-                        self.input_queue.put(user_input)
-                    elif user_input.lower().startswith("add "):
-                        self.input_queue.put(user_input)
-                    elif user_input.lower().startswith("pomodoro "):
-                        self.input_queue.put(user_input)
-                    elif user_input.lower() in ["pomodoro", "timer", "timer status"]:
-                        self.input_queue.put("pomodoro_status")
-                    elif user_input.lower().startswith("break "):
-                        self.input_queue.put(user_input)
-                    elif user_input.lower() in ["break", "break status"]:
-                        self.input_queue.put("break_status")
-                    else:
-                        # For other inputs during monitoring, just put in queue
-                        self.input_queue.put(user_input)
-                        
+                    self.input_queue.put(self._translate_command(user_input))
+
             except EOFError:
                 break
             except Exception:
                 # Ignore any other input errors
                 pass
 
+    def _poll_input(self, timeout):
+        """Wait up to timeout seconds for one line of user input.
+
+        On POSIX the line is read straight off stdin via select, so commands
+        take effect immediately instead of on the next queue poll; elsewhere
+        it falls back to the input thread's queue.
+        """
+        if self._use_select_input:
+            if self._stdin_eof:
+                time.sleep(timeout)
+                return None
+            try:
+                ready, _, _ = select.select([sys.stdin], [], [], timeout)
+            except (OSError, ValueError):
+                self._stdin_eof = True
+                return None
+            if not ready:
+                return None
+            line = sys.stdin.readline()
+            if not line:
+                # EOF: stop selecting on stdin or we'd spin on readiness
+                self._stdin_eof = True
+                return None
+            return self._translate_command(line.strip())
+
+        try:
+            return self.input_queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
     def wait_with_input_check(self, seconds):
         """Wait for specified seconds but check for user input periodically."""
         start_time = time.time()
 
-        while time.time() - start_time < seconds and not self.stop_monitoring:
-            # Check for input every 0.5 seconds
-            try:
-                user_input = self.input_queue.get(timeout=0.5)
+        while not self.stop_monitoring:
+            remaining = seconds - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            # Only wake twice a second when a pomodoro or break countdown
+            # needs refreshing; otherwise sleep the whole remainder in one
+            # wait - stdin readiness (or the input queue) interrupts it the
+            # moment the user types
+            timeout = 0.5 if (self.pomodoro_active or self.on_break) else remaining
+            user_input = self._poll_input(timeout)
+            if user_input is None:
+                # No input received, continue waiting
+                # Check pomodoro timer every 0.5 seconds for responsive completion notifications
+                if self.pomodoro_active:
+                    self.check_pomodoro_timer()
 
+                # Check break timer every 0.5 seconds for responsive completion notifications
+                if self.on_break:
+                    self.check_break_timer()
+                continue
+            try:
                 # Handle x command for exceptions
                 if user_input.lower().startswith("x "):
                     exception_text = user_input[2:].strip()
                     if exception_text:
                         self.productivity_exceptions.append(exception_text)
+                        self._rebuild_prompt_prefix()
                         print(f"Added exception: '{exception_text}'")
                         print(f"Total exceptions: {len(self.productivity_exceptions)}")
                     else:
@@ -2235,16 +3126,6 @@ Only suggest obvious completions or important additions. Be conservative.
                 elif user_input == "break_status":
                     self.show_break_status()
 
-            except queue.Empty:
-                # No input received, continue waiting
-                # Check pomodoro timer every 0.5 seconds for responsive completion notifications
-                if self.pomodoro_active:
-                    self.check_pomodoro_timer()
-                
-                # Check break timer every 0.5 seconds for responsive completion notifications
-                if self.on_break:
-                    self.check_break_timer()
-                pass
             except Exception as e:
                 self.debug_log(f"Error processing input: {e}")
 
@@ -2286,9 +3167,36 @@ Only suggest obvious completions or important additions. Be conservative.
             print("\nRunning in DEBUG mode - detailed logging enabled")
             print(f"Debug screenshots will be saved to: {self.debug_dir}")
 
-        # Start input monitoring thread
-        input_thread = threading.Thread(target=self.input_thread, daemon=True)
-        input_thread.start()
+        # Start input monitoring thread where stdin can't be select()ed;
+        # on POSIX the wait loop polls stdin directly
+        if not self._use_select_input:
+            input_thread = threading.Thread(target=self.input_thread, daemon=True)
+            input_thread.start()
+
+        # Track the mouse so most ticks can capture the active monitor only
+        if not self.test_mode:
+            self._start_mouse_listener()
+
+        # Overlap heavyweight cold starts with the pre-check wait: EasyOCR's
+        # first forward pass loads and compiles the torch weights (seconds),
+        # and the first API call pays TCP+TLS setup. models.list() is a free
+        # endpoint that just opens the connection.
+        if not self.test_mode:
+            def _warmup():
+                self._ensure_ocr_reader()
+                if self.ocr_reader is not None and OCR_TYPE == "easyocr":
+                    try:
+                        self.ocr_reader.readtext(np.zeros((64, 64, 3), dtype=np.uint8))
+                        self.debug_log("OCR warmup complete")
+                    except Exception as e:
+                        self.debug_log(f"OCR warmup failed: {e}")
+                try:
+                    self.client.models.list()
+                    self.debug_log("API connection warmup complete")
+                except Exception as e:
+                    self.debug_log(f"API warmup failed: {e}")
+
+            threading.Thread(target=_warmup, daemon=True).start()
 
         # Wait before first check with input monitoring
         if self.test_mode:
@@ -2312,16 +3220,39 @@ Only suggest obvious completions or important additions. Be conservative.
                     screenshots, extracted_texts = [], []  # No actual screenshots in test mode
                 else:
                     screenshots, extracted_texts = self.take_screenshot()
-                
+
                 # Check if workday is active before processing
                 if not self.workday_active:
                     break
-                
+
+                # Nothing on screen changed since the last check - the
+                # previous decision still stands, so skip the analysis
+                if self.last_frame_unchanged and not self.test_mode:
+                    self.debug_log("Screen unchanged, skipping analysis this cycle")
+                    if self.current_activity in ['SOCIAL_MEDIA', 'ENTERTAINMENT', 'DISTRACTION']:
+                        # A static distraction page re-confirms the standing
+                        # verdict; don't let the skip stretch the interval
+                        self._clean_streak = 0
+                    else:
+                        self._clean_streak += 1
+                    # Hourly summaries must keep firing even while skipping
+                    self.check_hourly_summary()
+                    effective_interval = self._effective_interval()
+                    print(f"\n⏳ Screen unchanged. Next check in {effective_interval:.0f} seconds...\n" + "-"*50)
+                    self.wait_with_input_check(effective_interval)
+                    continue
+
                 if screenshots or self.test_mode:
                     if self.test_mode:
                         # Use simulated activities for testing
                         category, description = self.simulate_activity_categorization()
                         print(f"🧪 TEST MODE - Simulated activity: {category.title()} - {description}")
+                    elif self._too_little_text_for_llm(extracted_texts):
+                        # Near-textless screen (bare desktop, lock screen):
+                        # not worth a model call; treat the tick as
+                        # uncategorized
+                        self.debug_log("Too little on-screen text to analyze, skipping categorization")
+                        category, description = None, ""
                     else:
                         # Categorize activity instead of just checking procrastination
                         category, description = self.categorize_activity(screenshots, extracted_texts)
@@ -2347,6 +3278,10 @@ Only suggest obvious completions or important additions. Be conservative.
                         
                         # Still check for interventions if it's unproductive
                         unproductive_categories = ['SOCIAL_MEDIA', 'ENTERTAINMENT', 'DISTRACTION']
+                        if category in unproductive_categories:
+                            self._clean_streak = 0
+                        else:
+                            self._clean_streak += 1
                         if category in unproductive_categories and not self.test_mode:
                             if self.pomodoro_active:
                                 # During pomodoro, show unproductive warning more subtly first
@@ -2379,20 +3314,31 @@ Only suggest obvious completions or important additions. Be conservative.
                                     print(f"\n{encouragement}")
                                 self.last_encouragement_time = current_time
                     else:
+                        self._clean_streak = 0
                         self.debug_log("Could not categorize activity")
                 
                 # Check for hourly summary
                 self.check_hourly_summary()
-                
+
                 # Check pomodoro timer
                 self.check_pomodoro_timer()
 
-                self.debug_log(f"Waiting {self.interval} seconds until next check...")
-                print(f"\n⏳ Next check in {self.interval} seconds...\n" + "-"*50)
-                self.wait_with_input_check(self.interval)
+                # Drop the frame references and collect before the long
+                # sleep; screenshot buffers are tens of MB per cycle and
+                # otherwise linger in loop variables until the next check
+                del screenshots, extracted_texts
+                gc.collect()
+
+                # Back off after a productive stretch; snap back on anything
+                # unproductive
+                effective_interval = self._effective_interval()
+                self.debug_log(f"Waiting {effective_interval:.0f} seconds until next check...")
+                print(f"\n⏳ Next check in {effective_interval:.0f} seconds...\n" + "-"*50)
+                self.wait_with_input_check(effective_interval)
             except KeyboardInterrupt:
                 print("\nProductivityGuard stopped.")
                 self.stop_monitoring = True
+                self._shutdown_executors()
                 break
             except Exception as e:
                 print(f"Error in main loop: {e}")
@@ -79,36 +79,35 @@ class TestProductivityGuard(unittest.TestCase):
     def test_debug_log_enabled(self):
         """Test debug_log when debug mode is enabled."""
         guard = ProductivityGuard(debug=True)
-        
-        with patch('builtins.print') as mock_print:
+
+        with patch('sys.stdout.write') as mock_write:
             guard.debug_log("Test message", {"key": "value"})
-            
-            # Should print both message and data
-            self.assertEqual(mock_print.call_count, 2)
-            call_args = [call[0][0] for call in mock_print.call_args_list]
-            self.assertTrue(any("Test message" in arg for arg in call_args))
-            self.assertTrue(any("key" in arg for arg in call_args))
-    
+
+            # Should emit message and data in a single write
+            self.assertEqual(mock_write.call_count, 1)
+            output = mock_write.call_args[0][0]
+            self.assertIn("Test message", output)
+            self.assertIn("key", output)
+
     def test_debug_log_disabled(self):
         """Test debug_log when debug mode is disabled."""
         guard = ProductivityGuard(debug=False)
-        
-        with patch('builtins.print') as mock_print:
+
+        with patch('sys.stdout.write') as mock_write:
             guard.debug_log("Test message", {"key": "value"})
-            
-            # Should not print anything
-            mock_print.assert_not_called()
-    
+
+            # Should not write anything
+            mock_write.assert_not_called()
+
     def test_debug_log_truncate_long_string(self):
         """Test debug_log truncates long string data."""
         guard = ProductivityGuard(debug=True)
-        
+
         long_string = "x" * 200
-        with patch('builtins.print') as mock_print:
+        with patch('sys.stdout.write') as mock_write:
             guard.debug_log("Test", long_string)
-            
-            call_args = [call[0][0] for call in mock_print.call_args_list]
-            self.assertTrue(any("truncated" in arg for arg in call_args))
+
+            self.assertIn("truncated", mock_write.call_args[0][0])
     
     def test_process_image_resize(self):
         """Test process_image resizes large images."""